@@ -1,25 +1,904 @@
+from __future__ import annotations
+
+import time
+
+_STARTUP_TIME = time.perf_counter()  # before the other imports, so cold-start timings include them
+
 import os
 import random
 import math
-import time
 import sys
 import csv
+import json
+import argparse
+import bisect
+import queue
+import threading
+import functools
+import itertools
+import operator
+import hashlib
+import io
+import tempfile
+import mmap
+import struct
+from array import array
 from datetime import datetime
 from collections import defaultdict
-from typing import List, Dict, Any, Optional, Tuple, Callable
-import tkinter as tk
-from tkinter import (
-    Tk, Frame, Label, Button, Canvas, Scrollbar, Listbox, Entry,
-    messagebox, ttk, SUNKEN, RAISED, FLAT, BOTH, RIGHT, LEFT, Y, END
-)
-from PIL import Image, ImageTk, ImageDraw
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Set, Any, Optional, Tuple, Callable, Iterable, Iterator
+
+# Heavy optional modules are imported on first use (see the _load_* helpers)
+np = None
+sqlite3 = None
+Image = ImageTk = ImageDraw = ImageFont = None
+
+ICON_FONT_PATH = "arial.ttf"
+ICON_OUTLINE_WIDTH = 2
+ICON_POLL_MS = 30  # how often the Tk loop collects icons finished by the render pool
+SAVE_POLL_MS = 50  # how often the Tk loop checks on a background results write
+DRAG_FRAME_MS = 16  # coalesced drag motion is applied at most once per ~60 Hz frame
+RESIZE_SETTLE_MS = 150  # relayout once <Configure> events stop arriving for this long
+ANIMATION_FRAME_MS = 16  # tick of the shared results animation loop
+ELIMINATION_TWEEN_SECONDS = 1.5  # flight time of an eliminated game into the trashcan
+
+
+def _load_tk_modules() -> None:
+    """Import Tk on first GUI use so headless tallies never load it"""
+    global tk, Tk, Frame, Label, Button, Canvas, Scrollbar, Listbox, Entry
+    global messagebox, ttk, tkfont, SUNKEN, RAISED, FLAT, BOTH, RIGHT, LEFT, Y, END
+    import tkinter as tk
+    from tkinter import (
+        Tk, Frame, Label, Button, Canvas, Scrollbar, Listbox, Entry,
+        messagebox, ttk, SUNKEN, RAISED, FLAT, BOTH, RIGHT, LEFT, Y, END
+    )
+    from tkinter import font as tkfont
+
+
+def _load_pil_modules() -> None:
+    """Import PIL the first time an icon or sprite is rendered"""
+    global Image, ImageTk, ImageDraw, ImageFont
+    if ImageTk is None:
+        from PIL import Image, ImageTk, ImageDraw, ImageFont
+
+
+def _load_numpy() -> bool:
+    """Import NumPy for the "numpy" tally backend; False when it is not installed"""
+    global np
+    if np is None:
+        try:
+            import numpy as np
+        except ImportError:
+            return False
+    return True
+
+
+def _load_sqlite3() -> None:
+    """Import sqlite3 when the history store is first opened rather than at startup"""
+    global sqlite3
+    if sqlite3 is None:
+        import sqlite3
+
+
+_umask: Optional[int] = None
+_umask_lock = threading.Lock()
+
+
+def _current_umask() -> int:
+    """The process umask, read on the first write; reading it means setting it, so only one thread may"""
+    global _umask
+    with _umask_lock:
+        if _umask is None:
+            _umask = os.umask(0o022)
+            os.umask(_umask)
+        return _umask
+
+
+def _write_atomic(path: str, content: Any, newline: Optional[str] = None) -> None:
+    """Write a text (str) or binary (bytes) file via a temp file in the same directory and an atomic rename"""
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.splitext(path)[1])
+    try:
+        if isinstance(content, (bytes, bytearray)):
+            f = open(fd, 'wb')
+        else:
+            f = open(fd, 'w', newline=newline, encoding='utf-8')
+        with f:
+            f.write(content)
+        # mkstemp creates 0600 files; give the result the mode a plain open() would have
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o666 & ~_current_umask()
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+@functools.lru_cache(maxsize=32)
+def _load_font(font_path: str, font_size: int) -> Any:
+    """Return the font at this path and size, loading it once per process"""
+    try:
+        return ImageFont.truetype(font_path, font_size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=4096)
+def _text_width(font: Any, text: str) -> float:
+    """Memoized font.getlength; fonts stay alive in the _load_font cache"""
+    return font.getlength(text)
+
+
+def _draw_outlined_text(draw: Any, xy: Tuple[float, float], text: str, font: Any) -> None:
+    """White icon text with a black outline, rasterized in a single stroked pass"""
+    draw.text(xy, text, fill='white', font=font, 
+              stroke_width=ICON_OUTLINE_WIDTH, stroke_fill='black')
+
+
+def _draw_outlined_text_multipass(draw: Any, xy: Tuple[float, float], text: str, font: Any) -> None:
+    """The original eight-offset outline, kept as the baseline for benchmark_icon_text"""
+    x_pos, y_pos = xy
+    border_width = ICON_OUTLINE_WIDTH
+    for dx in [-border_width, 0, border_width]:
+        for dy in [-border_width, 0, border_width]:
+            if dx != 0 or dy != 0:
+                draw.text((x_pos+dx, y_pos+dy), text, fill='black', font=font)
+    
+    draw.text((x_pos, y_pos), text, fill='white', font=font)
+
 
 # Model Classes
+class BallotStore(Sequence):
+    """Ranked ballots packed into one contiguous buffer of game ids.
+
+    Ballot ``i`` occupies ``data[offsets[i]:offsets[i + 1]]`` with one
+    unsigned byte per ranked game, so a million 15-game ballots take about
+    23 MB instead of a Python list of ints per ballot.
+    """
+
+    MAX_GAMES = 256
+
+    def __init__(self, ballots: Iterable[Sequence[int]] = ()):
+        self.data = array('B')
+        self.offsets = array('q', [0])
+        self.min_length = 0
+        self.max_length = 0
+        for ballot in ballots:
+            self.append(ballot)
+
+    def _ensure_writable(self) -> None:
+        """Copy a read-only (fixed_width) backing into owned arrays before the first mutation"""
+        if isinstance(self.data, memoryview):
+            data = array('B')
+            data.frombytes(self.data)
+            self.data = data
+            self.offsets = array('q', self.offsets)
+
+    def append(self, ballot: Sequence[int]) -> None:
+        self._ensure_writable()
+        self.data.extend(ballot)
+        self.offsets.append(len(self.data))
+        length = len(ballot)
+        if len(self.offsets) == 2:
+            self.min_length = self.max_length = length
+        else:
+            self.min_length = min(self.min_length, length)
+            self.max_length = max(self.max_length, length)
+
+    def extend(self, other: BallotStore) -> None:
+        """Append every ballot of another store"""
+        if not other:
+            return
+        self._ensure_writable()
+        if not self:
+            self.min_length, self.max_length = other.min_length, other.max_length
+        else:
+            self.min_length = min(self.min_length, other.min_length)
+            self.max_length = max(self.max_length, other.max_length)
+        base = len(self.data)
+        self.data.extend(other.data)
+        self.offsets.extend(offset + base for offset in other.offsets[1:])
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ballot index out of range")
+        return self.data[self.offsets[index]:self.offsets[index + 1]]
+
+    def __iter__(self) -> Iterator[array]:
+        data = self.data
+        offsets = self.offsets
+        for i in range(len(offsets) - 1):
+            yield data[offsets[i]:offsets[i + 1]]
+
+    def lengths(self) -> array:
+        """Number of ranked games on each ballot"""
+        offsets = self.offsets
+        return array('q', map(operator.sub, offsets[1:], offsets))
+
+    def is_uniform(self) -> bool:
+        """Whether every ballot ranks the same number of games (rows are fixed width)"""
+        return self.min_length == self.max_length
+
+    @classmethod
+    def fixed_width(cls, data: Any, width: int) -> BallotStore:
+        """Store over a buffer of ``width``-byte rows, e.g. a memory-mapped file, without copying it
+
+        The buffer is only read; the first append or extend copies it into an owned array.
+        """
+        store = cls()
+        store.data = memoryview(data)
+        store.offsets = range(0, len(store.data) + 1, width or 1)  # width 0 only for an empty store
+        store.min_length = store.max_length = width if len(store.data) else 0
+        return store
+
+
+class BallotArchive:
+    """Compact binary ballots-and-results file, read through a memory map.
+
+    Layout (little-endian): a fixed header, the game table as length-prefixed
+    UTF-8 names, then one fixed-width row of game ids per ballot (one byte
+    per rank, zero padded to the longest ballot), a uint16 ranked-length per
+    ballot only when ballots are ragged, and finally one float64 total per
+    game per round (NaN once a game is eliminated). Sections start on 8-byte
+    boundaries. Uniform ballots are handed to the tally engines as a view of
+    the mapping, so a million-ballot archive is tallied without parsing.
+    """
+    EXTENSION = ".jaxb"
+    MAGIC = b"JAXB"
+    VERSION = 1
+    RAGGED = 0x1
+    HEADER = struct.Struct("<4sHHHHQI4x")  # magic, version, flags, games, width, ballots, rounds
+
+    def __init__(self, games: List[str], votes: BallotStore, totals: Any):
+        self.games = games
+        self.votes = votes
+        self.totals = totals  # flat rounds x games float64 view
+
+    @staticmethod
+    def _pad(size: int) -> int:
+        return -size % 8
+
+    @staticmethod
+    def _repeats_a_rank(raw: bytes, width: int, lengths: Optional[array] = None) -> bool:
+        """True if any row ranks a game twice; ragged rows are only checked up to their length."""
+        if lengths is not None:
+            return any(len(set(raw[i * width:i * width + length])) != length
+                       for i, length in enumerate(lengths))
+        # Uniform rows: XOR each pair of rank columns as one big int; a zero byte marks a repeat,
+        # and (x - 0x0101..) & ~x & 0x8080.. is non-zero exactly when x has one
+        count = len(raw) // width if width else 0
+        ones = int.from_bytes(b"\x01" * count, "little")
+        highs = ones << 7
+        columns = [int.from_bytes(raw[rank::width], "little") for rank in range(width)]
+        return any(((a ^ b) - ones) & ~(a ^ b) & highs for a, b in itertools.combinations(columns, 2))
+
+    @classmethod
+    def encode(cls, games: List[str], votes: Sequence[Sequence[int]], 
+               rounds: List[Dict[str, Any]] = ()) -> bytes:
+        if not isinstance(votes, BallotStore):
+            votes = BallotStore(votes)
+        width = votes.max_length
+        ragged = not votes.is_uniform()
+        
+        out = bytearray(cls.HEADER.pack(cls.MAGIC, cls.VERSION, cls.RAGGED if ragged else 0, 
+                                        len(games), width, len(votes), len(rounds)))
+        for game in games:
+            name = game.encode("utf-8")
+            out += struct.pack("<H", len(name)) + name
+        out += bytes(cls._pad(len(out)))
+        
+        if ragged:
+            for ballot in votes:
+                out += ballot.tobytes() + bytes(width - len(ballot))
+        else:
+            out += votes.data  # already fixed-width rows
+        out += bytes(cls._pad(len(out)))
+        if ragged:
+            lengths = array('H', votes.lengths())
+            if sys.byteorder == "big":
+                lengths.byteswap()
+            out += lengths.tobytes() + bytes(cls._pad(2 * len(lengths)))
+        
+        totals = array('d', [math.nan]) * (len(rounds) * len(games))
+        for round_index, round_data in enumerate(rounds):
+            base = round_index * len(games)
+            for game_id, game in enumerate(games):
+                if game in round_data.get("game_totals", {}):
+                    totals[base + game_id] = round_data["game_totals"][game]
+        if sys.byteorder == "big":
+            totals.byteswap()
+        out += totals.tobytes()
+        return bytes(out)
+
+    @staticmethod
+    def _section(view: memoryview, position: int, size: int, path: str) -> memoryview:
+        """The ``size`` bytes at ``position``, refusing to read past the end of the file"""
+        if position + size > len(view):
+            raise ValueError(f"{path}: truncated or corrupt ballot archive")
+        return view[position:position + size]
+
+    @classmethod
+    def open(cls, path: str) -> BallotArchive:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < cls.HEADER.size:
+                raise ValueError(f"{path}: not a ballot archive")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        magic, version, flags, num_games, width, num_ballots, num_rounds = cls.HEADER.unpack_from(view)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(f"{path}: not a version {cls.VERSION} ballot archive")
+        
+        position = cls.HEADER.size
+        games = []
+        for _ in range(num_games):
+            (size,) = struct.unpack("<H", cls._section(view, position, 2, path))
+            games.append(bytes(cls._section(view, position + 2, size, path)).decode("utf-8"))
+            position += 2 + size
+        position += cls._pad(position)
+        
+        if num_ballots and not width:
+            raise ValueError(f"{path}: truncated or corrupt ballot archive")
+        rows = cls._section(view, position, num_ballots * width, path)
+        position += len(rows) + cls._pad(len(rows))
+        raw = rows.tobytes()
+        # Every rank must name a game on the slate: deleting the valid ids in one C pass leaves nothing
+        if raw.translate(None, bytes(range(num_games))):
+            raise ValueError(f"{path}: ballot archive ranks a game missing from its game table")
+        lengths = None
+        if flags & cls.RAGGED:
+            lengths = array('H')
+            lengths.frombytes(cls._section(view, position, 2 * num_ballots, path))
+            if sys.byteorder == "big":
+                lengths.byteswap()
+            if lengths and max(lengths) > width:
+                raise ValueError(f"{path}: truncated or corrupt ballot archive")
+            position += 2 * num_ballots + cls._pad(2 * num_ballots)
+        if cls._repeats_a_rank(raw, width, lengths):
+            raise ValueError(f"{path}: ballot archive ranks the same game twice on one ballot")
+        if lengths is not None:
+            votes = BallotStore(rows[i * width:i * width + length] for i, length in enumerate(lengths))
+        else:
+            votes = BallotStore.fixed_width(rows, width)
+        
+        totals = cls._section(view, position, 8 * num_rounds * num_games, path)
+        if sys.byteorder == "big":
+            swapped = array('d')
+            swapped.frombytes(totals)
+            swapped.byteswap()
+            totals = swapped
+        else:
+            totals = totals.cast('d')
+        return cls(games, votes, totals)
+
+    def round_totals(self, round_index: int) -> Dict[str, float]:
+        """Per-game totals of one stored round, leaving out eliminated games"""
+        base = round_index * len(self.games)
+        totals = self.totals[base:base + len(self.games)]
+        return {game: total for game, total in zip(self.games, totals) if not math.isnan(total)}
+
+    @property
+    def num_rounds(self) -> int:
+        return len(self.totals) // len(self.games) if self.games else 0
+
+
+class InitialPointsDistribution(Sequence):
+    """Lazily formatted "Ballot N: game:points, ..." lines for the results metadata"""
+
+    def __init__(self, games: List[str], votes: Sequence[Sequence[int]]):
+        self.games = games
+        self.votes = votes
+
+    def __len__(self) -> int:
+        return len(self.votes)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        vote = self.votes[index]
+        points_desc = [f"{self.games[game_id]}:{len(vote) - j}" for j, game_id in enumerate(vote)]
+        return f"Ballot {index+1}: {', '.join(points_desc)}"
+
+
+class BaseTallyEngine:
+    """Shared round logic for the Jax method tally backends.
+
+    Subclasses keep per-game running ``totals`` indexed by game id and
+    implement ``eliminate`` and ``_place_counts``.
+    """
+
+    def __init__(self, num_games: int):
+        self.num_games = num_games
+
+    def active_ids(self) -> List[int]:
+        """Return the ids of games still in the running, in game order"""
+        return [game_id for game_id in range(self.num_games) if self.active[game_id]]
+
+    def majority_id(self) -> Optional[int]:
+        """Return the game holding more than 51% of all active points, if any"""
+        active_ids = self.active_ids()
+        total_points = sum(self.totals[game_id] for game_id in active_ids)
+        for game_id in active_ids:
+            if self.totals[game_id] > total_points * 0.51:
+                return game_id
+        return None
+
+    def eliminate(self, eliminated_id: int) -> None:
+        raise NotImplementedError
+
+    def _place_counts(self, candidates: List[int], depth: int) -> List[int]:
+        """Count, per candidate, the ballots ranking it depth-th worst among candidates"""
+        raise NotImplementedError
+
+    def break_tie(self, candidates: List[int]) -> int:
+        # Find candidate with most last place votes
+        last_place_counts = self._place_counts(candidates, 0)
+        max_last_place = max(last_place_counts)
+        worst_candidates = [c for c, count in zip(candidates, last_place_counts) if count == max_last_place]
+        
+        if len(worst_candidates) == 1:
+            return worst_candidates[0]
+        
+        # If still tied, check second-to-last place votes, etc.
+        return self._break_tie_deep(worst_candidates, 1)
+
+    def _break_tie_deep(self, candidates: List[int], depth: int) -> int:
+        if len(candidates) == 1:
+            return candidates[0]
+        
+        # Find candidate with most votes at this depth (depth = 1 means second worst, etc.)
+        place_counts = self._place_counts(candidates, depth)
+        max_count = max(place_counts)
+        worst_candidates = [c for c, count in zip(candidates, place_counts) if count == max_count]
+        
+        if len(worst_candidates) == 1:
+            return worst_candidates[0]
+        
+        # If still tied, go deeper
+        if depth < len(candidates):
+            return self._break_tie_deep(worst_candidates, depth + 1)
+        
+        # If all else fails, random choice
+        return random.choice(candidates)
+
+
+class ArrayTallyEngine(BaseTallyEngine):
+    """Running Jax method tally backed by flat numeric arrays indexed by game id.
+
+    Per-ballot points live in one contiguous ``array('d')`` laid out as
+    ``ballot * num_games + game_id`` and per-game totals are kept up to date
+    incrementally, so an elimination only touches the redistributed deltas
+    instead of re-summing every ballot each round.
+    """
+
+    def __init__(self, num_games: int, votes: Sequence[Sequence[int]]):
+        super().__init__(num_games)
+        self.votes = votes
+        self.ballot_points = array('d', bytes(8 * num_games * len(votes)))
+        self.totals = array('d', bytes(8 * num_games))
+        self.active = bytearray(b'\x01' * num_games)
+        
+        for i, vote in enumerate(votes):
+            base = i * num_games
+            for j, game_id in enumerate(vote):
+                points = len(vote) - j  # Top rank gets highest points
+                self.ballot_points[base + game_id] = points
+                self.totals[game_id] += points
+
+    def eliminate(self, eliminated_id: int) -> None:
+        """Drop a game and cascade its points down each ballot (50% per step)"""
+        self.active[eliminated_id] = 0
+        num_games = self.num_games
+        ballot_points = self.ballot_points
+        totals = self.totals
+        active = self.active
+        
+        for i, vote in enumerate(self.votes):
+            base = i * num_games
+            points_pool = ballot_points[base + eliminated_id]
+            if not points_pool:
+                continue
+            
+            ballot_points[base + eliminated_id] = 0.0
+            totals[eliminated_id] -= points_pool
+            
+            # Redistribute points with 50% cascade to the remaining games in ballot order
+            for game_id in vote:
+                if not active[game_id]:
+                    continue
+                allocation = points_pool * 0.5
+                ballot_points[base + game_id] += allocation
+                totals[game_id] += allocation
+                points_pool -= allocation
+                
+                if points_pool < 0.001:  # negligible amount
+                    break
+
+    def _place_counts(self, candidates: List[int], depth: int) -> List[int]:
+        # Map game id -> candidate slot (-1 for games not in the tie)
+        slot = [-1] * self.num_games
+        for i, candidate in enumerate(candidates):
+            slot[candidate] = i
+        place_counts = [0] * len(candidates)
+        
+        for vote in self.votes:
+            # Walk the ballot from its worst rank and stop at the depth-th worst candidate
+            seen = 0
+            for game_id in reversed(vote):
+                candidate_slot = slot[game_id]
+                if candidate_slot < 0:
+                    continue
+                if seen == depth:
+                    place_counts[candidate_slot] += 1
+                    break
+                seen += 1
+        
+        return place_counts
+
+
+class NumpyTallyEngine(BaseTallyEngine):
+    """Vectorized Jax method tally over (n_ballots x n_games) NumPy matrices.
+
+    ``ranks`` holds the rank of every game on every ballot and ``points`` the
+    float points each ballot currently gives its rank positions, so the 50%
+    cascade runs along contiguous rows. Unranked entries use ``num_games`` as
+    a sentinel and both matrices carry one padding column for it. Round
+    totals, the cascade and the majority check are whole-matrix operations.
+    """
+
+    def __init__(self, num_games: int, votes: Sequence[Sequence[int]]):
+        super().__init__(num_games)
+        num_ballots = len(votes)
+        
+        # Game ids by rank for each ballot, padded with the sentinel
+        self.order = np.full((num_ballots, num_games + 1), num_games, dtype=np.int16)
+        try:
+            if isinstance(votes, BallotStore) and votes.is_uniform():
+                # Fixed-width rows: view the packed buffer directly as a matrix
+                ballots = np.frombuffer(votes.data, dtype=np.uint8).reshape(num_ballots, -1)
+            else:
+                ballots = np.array(votes, dtype=np.int16).reshape(num_ballots, -1)
+            self.order[:, :ballots.shape[1]] = ballots
+        except ValueError:
+            # Ragged (partially ranked) ballots
+            for i, vote in enumerate(votes):
+                self.order[i, :len(vote)] = vote
+        
+        ranked = self.order < num_games
+        rows, positions = np.nonzero(ranked)
+        self.ranks = np.full((num_ballots, num_games + 1), num_games, dtype=np.int16)
+        self.ranks[rows, self.order[rows, positions]] = positions
+        
+        # Top rank gets highest points
+        lengths = ranked.sum(axis=1)
+        self.points = np.where(ranked, lengths[:, None] - np.arange(num_games + 1), 0).astype(np.float64)
+        self.live = ranked
+        self.active = np.ones(num_games, dtype=bool)
+        self._ballot_rows = np.arange(num_ballots)
+        self._game_bins = self.order.ravel().astype(np.intp)
+        self._update_totals()
+
+    def _update_totals(self) -> None:
+        # bincount accumulates ballot by ballot, matching a sequential per-game sum
+        totals = np.bincount(self._game_bins, weights=self.points.ravel(), minlength=self.num_games + 1)
+        self.totals = totals[:self.num_games]
+
+    def majority_id(self) -> Optional[int]:
+        active_ids = np.flatnonzero(self.active)
+        active_totals = self.totals[active_ids]
+        leaders = active_ids[active_totals > active_totals.sum() * 0.51]
+        return int(leaders[0]) if len(leaders) else None
+
+    def eliminate(self, eliminated_id: int) -> None:
+        """Drop a game and cascade its points down each ballot (50% per step)"""
+        self.active[eliminated_id] = False
+        eliminated_ranks = self.ranks[:, eliminated_id]
+        points_pool = self.points[self._ballot_rows, eliminated_ranks]
+        self.points[self._ballot_rows, eliminated_ranks] = 0.0
+        self.live[self._ballot_rows, eliminated_ranks] = False
+        
+        # The k-th remaining game on a ballot receives pool / 2**k, and the
+        # cascade continues while what is left of the pool is at least 0.001
+        step = np.cumsum(self.live, axis=1, dtype=np.int16)
+        allocate = self.live & (step <= self._cascade_lengths(points_pool)[:, None])
+        self.points += np.where(allocate, np.ldexp(points_pool[:, None], -step), 0.0)
+        self._update_totals()
+
+    def _cascade_lengths(self, points_pool: Any) -> Any:
+        """Number of games each ballot's pool is split across before it drops below 0.001"""
+        extra = np.floor(np.log2(np.maximum(points_pool, 0.001) / 0.001)).astype(np.int16)
+        # log2 can be off by one right at the boundary; settle it with exact halvings
+        extra += np.ldexp(points_pool, -(extra + 1)) >= 0.001
+        extra -= (extra > 0) & (np.ldexp(points_pool, -extra) < 0.001)
+        return extra + 1
+
+    def _place_counts(self, candidates: List[int], depth: int) -> List[int]:
+        if depth >= len(candidates):
+            return [0] * len(candidates)
+        
+        candidate_ranks = self.ranks[:, candidates].astype(np.int32)
+        candidate_ranks[candidate_ranks >= self.num_games] = -1
+        
+        # Keep ballots ranking more than `depth` candidates, then take the depth-th worst
+        deep_enough = (candidate_ranks >= 0).sum(axis=1) > depth
+        worst_first = np.argsort(-candidate_ranks[deep_enough], axis=1)
+        return np.bincount(worst_first[:, depth], minlength=len(candidates)).tolist()
+
+
+class IconCache:
+    """PNG cache of rendered game icons on disk, evicting least recently used files past max_bytes"""
+    VERSION = 1  # bump when icon rendering changes so stale files are never served
+    
+    def __init__(self, directory: str, max_bytes: int = 8 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._total_bytes: Optional[int] = None  # measured on the first store
+        self._lock = threading.Lock()  # icons are stored from the render pool threads
+
+    @staticmethod
+    def key(game_name: str, color: str, width: int, height: int, 
+            font_path: str, font_size: int) -> str:
+        raw = json.dumps([IconCache.VERSION, game_name, color, width, height, 
+                          font_path, font_size, ICON_OUTLINE_WIDTH])
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.png")
+
+    def load(self, key: str) -> Optional[Image.Image]:
+        path = self._path(key)
+        try:
+            with Image.open(path) as img:
+                img.load()
+                icon = img.convert('RGB')
+            os.utime(path)  # mark as recently used for eviction
+        except (OSError, ValueError):
+            return None
+        return icon
+
+    def store(self, key: str, img: Image.Image) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            img.save(tmp_path, format="PNG")
+            os.replace(tmp_path, path)
+            with self._lock:
+                if self._total_bytes is None:
+                    self._total_bytes = sum(size for _, size, _ in self._entries())
+                else:
+                    self._total_bytes += os.path.getsize(path)
+                if self._total_bytes > self.max_bytes:
+                    self._evict()
+        except OSError:
+            # The cache is an optimization only; a failed write just means a re-render later
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".png"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self) -> None:
+        """Drop the oldest icons until the cache is back under three quarters of max_bytes"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 3 // 4
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._total_bytes = total
+
+
+class HistoryStore:
+    """Append-only SQLite log of saved elections, indexed by game, voter and date.
+
+    Each saved election is one ``elections`` row holding the slate, the
+    packed ballots and the rounds as JSON, plus one ``election_games`` row
+    per game and one ``election_voters`` row per ballot. Rows are never
+    updated or deleted, so election ids grow with time and the per-game and
+    per-voter indexes answer "the last N nights" without a sort.
+    """
+    FILENAME = "history.sqlite3"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS elections (
+            id INTEGER PRIMARY KEY,
+            saved_at TEXT NOT NULL,
+            results_file TEXT,
+            method TEXT,
+            winner TEXT,
+            games TEXT NOT NULL,
+            ballot_data BLOB NOT NULL,
+            ballot_offsets BLOB NOT NULL,
+            voter_names TEXT NOT NULL,
+            rounds TEXT NOT NULL,
+            podium TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS elections_saved_at ON elections (saved_at);
+        CREATE TABLE IF NOT EXISTS election_games (
+            election_id INTEGER NOT NULL REFERENCES elections (id),
+            game TEXT NOT NULL,
+            position INTEGER,
+            final_score REAL,
+            first_round_score REAL,
+            eliminated_round INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS election_games_game ON election_games (game, election_id);
+        CREATE TABLE IF NOT EXISTS election_voters (
+            election_id INTEGER NOT NULL REFERENCES elections (id),
+            voter TEXT NOT NULL,
+            ballot INTEGER NOT NULL,
+            top_choice TEXT
+        );
+        CREATE INDEX IF NOT EXISTS election_voters_voter ON election_voters (voter, election_id);
+        CREATE TRIGGER IF NOT EXISTS elections_no_update BEFORE UPDATE ON elections
+        BEGIN SELECT RAISE(ABORT, 'election history is append-only'); END;
+        CREATE TRIGGER IF NOT EXISTS elections_no_delete BEFORE DELETE ON elections
+        BEGIN SELECT RAISE(ABORT, 'election history is append-only'); END;
+        CREATE TRIGGER IF NOT EXISTS election_games_no_update BEFORE UPDATE ON election_games
+        BEGIN SELECT RAISE(ABORT, 'election history is append-only'); END;
+        CREATE TRIGGER IF NOT EXISTS election_games_no_delete BEFORE DELETE ON election_games
+        BEGIN SELECT RAISE(ABORT, 'election history is append-only'); END;
+        CREATE TRIGGER IF NOT EXISTS election_voters_no_update BEFORE UPDATE ON election_voters
+        BEGIN SELECT RAISE(ABORT, 'election history is append-only'); END;
+        CREATE TRIGGER IF NOT EXISTS election_voters_no_delete BEFORE DELETE ON election_voters
+        BEGIN SELECT RAISE(ABORT, 'election history is append-only'); END;
+    """
+    
+    _schema_ready: Set[str] = set()  # stores whose schema this process has created or checked
+    
+    def __init__(self, path: str):
+        _load_sqlite3()
+        self.path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per call: saves run on the writer thread, queries on the caller's
+        key = os.path.abspath(self.path)
+        create = key not in self._schema_ready or not os.path.exists(self.path)
+        connection = sqlite3.connect(self.path)
+        connection.row_factory = sqlite3.Row
+        if create:
+            connection.executescript(self.SCHEMA)
+            self._schema_ready.add(key)
+        return connection
+
+    def record(self, model: JaxVotingSystem, saved_at: datetime, 
+               results_file: Optional[str] = None) -> int:
+        """Append the model's tallied election and return its id"""
+        round_results = model.round_results
+        rounds = round_results.get("rounds", [])
+        podium = round_results.get("podium", [])
+        votes = model.votes if isinstance(model.votes, BallotStore) else BallotStore(model.votes)
+        offsets = array('q', votes.offsets)
+        if sys.byteorder == "big":
+            offsets.byteswap()  # stored little-endian
+        
+        placed = {entry["game"]: entry for entry in podium}
+        first_totals = rounds[0].get("game_totals", {}) if rounds else {}
+        last_totals: Dict[str, float] = {}
+        eliminated_in: Dict[str, int] = {}
+        for round_data in rounds:
+            last_totals.update(round_data.get("game_totals", {}))
+            if "eliminated" in round_data:
+                eliminated_in[round_data["eliminated"]] = round_data["round"]
+        
+        connection = self._connect()
+        try:
+            with connection:
+                election_id = connection.execute(
+                    "INSERT INTO elections (saved_at, results_file, method, winner, games, "
+                    "ballot_data, ballot_offsets, voter_names, rounds, podium) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (saved_at.isoformat(timespec="seconds"), results_file,
+                     round_results.get("metadata", {}).get("method"), model.winner,
+                     json.dumps(model.games), votes.data.tobytes(), offsets.tobytes(),
+                     json.dumps(model.voter_names), json.dumps(rounds), json.dumps(podium))
+                ).lastrowid
+                connection.executemany(
+                    "INSERT INTO election_games VALUES (?, ?, ?, ?, ?, ?)",
+                    [(election_id, game, placed[game]["position"] if game in placed else None,
+                      placed[game]["score"] if game in placed else last_totals.get(game),
+                      first_totals.get(game), eliminated_in.get(game))
+                     for game in model.games]
+                )
+                connection.executemany(
+                    "INSERT INTO election_voters VALUES (?, ?, ?, ?)",
+                    [(election_id, voter, ballot_index, model.games[ballot[0]] if ballot else None)
+                     for ballot_index, (voter, ballot) in enumerate(zip(model.voter_names, votes))
+                     if voter is not None]
+                )
+        finally:
+            connection.close()
+        return election_id
+
+    def _query(self, sql: str, params: Tuple[Any, ...]) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return []
+        connection = self._connect()
+        try:
+            return [dict(row) for row in connection.execute(sql, params)]
+        finally:
+            connection.close()
+
+    def game_history(self, game: str, limit: int = 200) -> List[Dict[str, Any]]:
+        """How a game placed in its last ``limit`` elections, newest first"""
+        return self._query(
+            "SELECT e.id AS election_id, e.saved_at, e.winner, g.position, g.final_score, "
+            "g.first_round_score, g.eliminated_round "
+            "FROM election_games g JOIN elections e ON e.id = g.election_id "
+            "WHERE g.game = ? ORDER BY g.election_id DESC LIMIT ?", (game, limit))
+
+    def voter_history(self, voter: str, limit: int = 200) -> List[Dict[str, Any]]:
+        """A voter's top choices and the winner in their last ``limit`` elections, newest first.
+
+        A voter can cast several ballots in one election, so this returns one
+        row per ballot and the limit counts distinct elections.
+        """
+        return self._query(
+            "SELECT e.id AS election_id, e.saved_at, e.winner, v.ballot, v.top_choice "
+            "FROM election_voters v JOIN elections e ON e.id = v.election_id "
+            "WHERE v.voter = ? AND v.election_id IN ("
+            "SELECT DISTINCT election_id FROM election_voters WHERE voter = ? "
+            "ORDER BY election_id DESC LIMIT ?) "
+            "ORDER BY v.election_id DESC, v.ballot", (voter, voter, limit))
+
+    def elections_between(self, start: str, end: str = "9999") -> List[Dict[str, Any]]:
+        """Elections saved in [start, end), compared as ISO date/time strings"""
+        return self._query(
+            "SELECT id AS election_id, saved_at, winner, results_file, games FROM elections "
+            "WHERE saved_at >= ? AND saved_at < ? ORDER BY saved_at", (start, end))
+
+    def load_election(self, election_id: int) -> Optional[Dict[str, Any]]:
+        """A stored election with its games, ballots, voters, rounds and podium decoded"""
+        rows = self._query("SELECT * FROM elections WHERE id = ?", (election_id,))
+        if not rows:
+            return None
+        election = rows[0]
+        votes = BallotStore()
+        votes.data = array('B', election.pop("ballot_data"))
+        offsets = array('q', election.pop("ballot_offsets"))
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        votes.offsets = offsets
+        lengths = votes.lengths()
+        if lengths:
+            votes.min_length, votes.max_length = min(lengths), max(lengths)
+        election["votes"] = votes
+        for column in ("games", "voter_names", "rounds", "podium"):
+            election[column] = json.loads(election[column])
+        return election
+
+
 class JaxVotingSystem:
     def __init__(self):
         self.games: List[str] = []
-        self.votes: List[List[int]] = []
-        self.voter_names: List[str] = ["Kade", "Jake", "Paden", "Austin", "Jaxson"]
+        # Kept in step with self.games by _register_game/remove_game
+        self.game_ids: Dict[str, int] = {}
+        self.game_colors: Dict[str, str] = {}
+        self.votes: BallotStore = BallotStore()
+        # Positional: voter_names[i] cast ballot i (None for anonymous imported ballots)
+        self.voter_names: List[Optional[str]] = ["Kade", "Jake", "Paden", "Austin", "Jaxson"]
         self.current_voter: int = 0
         self.ranked_games: List[Optional[str]] = []
         self.game_images: Dict[str, ImageTk.PhotoImage] = {}
@@ -34,130 +913,256 @@ class JaxVotingSystem:
         self.eliminated_points: float = 0.0
         self.original_game_order: List[str] = []
         self.num_voters: int = 0
+        self.tally_backend: str = "python"  # "python" or "numpy"
+        self._saved_results: Optional[Tuple[str, str]] = None  # (content hash, txt path) of the last save
+        self.icon_cache: IconCache = IconCache(os.path.join("voting_results", "icon_cache"))
 
     def add_game(self, game_name: str) -> bool:
-        if game_name and game_name not in self.games and len(self.games) < 15:
-            self.games.append(game_name)
+        if game_name and game_name not in self.game_ids and len(self.games) < 15:
+            self._register_game(game_name)
             return True
         return False
 
     def remove_game(self, game_name: str) -> bool:
-        if game_name in self.games:
-            self.games.remove(game_name)
+        if game_name in self.game_ids:
+            index = self.game_ids.pop(game_name)
+            del self.games[index]
+            for shifted_index in range(index, len(self.games)):
+                self.game_ids[self.games[shifted_index]] = shifted_index
+            del self.game_colors[game_name]
             if game_name in self.game_images:
                 del self.game_images[game_name]
             return True
         return False
 
-    def create_game_icon(self, game_name: str) -> bool:
-        if game_name not in self.game_images:
-            color = self.color_palette[self.next_color_index]
-            self.next_color_index = (self.next_color_index + 1) % len(self.color_palette)
-            
-            base_width = 150
-            base_height = 75
-            min_width = 100
-            max_width = 500
+    def _register_game(self, game_name: str) -> int:
+        """Append a game, giving it the next palette color for the rest of the session"""
+        game_id = self.game_ids[game_name] = len(self.games)
+        self.games.append(game_name)
+        self.game_colors[game_name] = self.next_icon_color()
+        return game_id
+
+    def game_color(self, game_name: str, default: str = "gray") -> str:
+        return self.game_colors.get(game_name, default)
+
+    def next_icon_color(self) -> str:
+        color = self.color_palette[self.next_color_index]
+        self.next_color_index = (self.next_color_index + 1) % len(self.color_palette)
+        return color
+
+    def load_game_icon(self, game_name: str, color: str) -> Image.Image:
+        """Return the icon from the on-disk cache, rendering and storing it on a miss"""
+        _load_pil_modules()
+        width, height, font_size = self._icon_layout(game_name)
+        key = IconCache.key(game_name=game_name, color=color, width=width, height=height, 
+                            font_path=ICON_FONT_PATH, font_size=font_size)
+        img = self.icon_cache.load(key)
+        if img is None:
+            img = self.render_game_icon(game_name, color)
+            self.icon_cache.store(key, img)
+        return img
+
+    @staticmethod
+    def _icon_layout(game_name: str) -> Tuple[int, int, int]:
+        """Icon width, height and font size for a name of this length"""
+        base_width = 150
+        base_height = 75
+        min_width = 100
+        max_width = 500
+        
+        name_length = len(game_name)
+        if name_length <= 10:
+            icon_width = min_width
+        elif name_length <= 20:
+            icon_width = base_width
+        else:
+            icon_width = min(max_width, base_width + (name_length - 20) * 8)
+        
+        if name_length <= 10:
+            font_size = 24
+        elif name_length <= 20:
+            font_size = 20
+        elif name_length <= 30:
+            font_size = 16
+        else:
+            font_size = 14
+        
+        return icon_width, base_height, font_size
+
+    def render_game_icon(self, game_name: str, color: str, 
+                         draw_text: Optional[Callable[..., None]] = None) -> Image.Image:
+        """Render the icon as a PIL image; PhotoImage conversion is left to the caller"""
+        _load_pil_modules()
+        draw_text = draw_text or _draw_outlined_text
+        
+        icon_width, icon_height, font_size = self._icon_layout(game_name)
+        img = Image.new('RGB', (icon_width, icon_height), color)
+        draw = ImageDraw.Draw(img)
+        
+        try:
+            font = _load_font(ICON_FONT_PATH, font_size)
+            text_width = _text_width(font, game_name)
             
-            name_length = len(game_name)
-            if name_length <= 10:
-                icon_width = min_width
-            elif name_length <= 20:
-                icon_width = base_width
+            max_text_width = icon_width - 20
+            if text_width > max_text_width:
+                lines = self._wrap_text(draw, game_name, font, max_text_width)
+                self._draw_multiline_text(draw, lines, icon_width, icon_height, font, draw_text)
             else:
-                icon_width = min(max_width, base_width + (name_length - 20) * 8)
-            
-            icon_height = base_height
-            
-            img = Image.new('RGB', (icon_width, icon_height), color)
-            draw = ImageDraw.Draw(img)
-            
-            try:
-                from PIL import ImageFont
-                
-                if name_length <= 10:
-                    font_size = 24
-                elif name_length <= 20:
-                    font_size = 20
-                elif name_length <= 30:
-                    font_size = 16
-                else:
-                    font_size = 14
-                
-                try:
-                    font = ImageFont.truetype("arial.ttf", font_size)
-                except:
-                    font = ImageFont.load_default()
-                
-                text_width = font.getlength(game_name)
-                
-                max_text_width = icon_width - 20
-                if text_width > max_text_width:
-                    lines = self._wrap_text(draw, game_name, font, max_text_width)
-                    self._draw_multiline_text(draw, lines, icon_width, icon_height, font)
-                else:
-                    self._draw_single_line_text(draw, game_name, icon_width, icon_height, font, text_width)
-            except:
-                draw.text((10, 30), game_name, fill='white')
-                
-            self.game_images[game_name] = ImageTk.PhotoImage(img)
-            return True
-        return False
+                self._draw_single_line_text(draw, game_name, icon_width, icon_height, font, text_width, draw_text)
+        except:
+            draw.text((10, 30), game_name, fill='white')
+        
+        return img
 
     def _wrap_text(self, draw: ImageDraw.Draw, text: str, font: Any, max_width: int) -> List[str]:
-        words = text.split()
+        # Line widths are summed from cached word widths instead of re-measuring
+        # every candidate line, so wrapping is linear in the number of words
+        space_width = _text_width(font, " ")
         lines = []
-        current_line = ""
+        current_words: List[str] = []
+        current_width = 0.0
         
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            test_width = font.getlength(test_line)
+        for word in text.split():
+            word_width = _text_width(font, word)
+            test_width = current_width + space_width + word_width if current_words else word_width
             
             if test_width <= max_width:
-                current_line = test_line
+                current_words.append(word)
+                current_width = test_width
             else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
+                if current_words:
+                    lines.append(" ".join(current_words))
+                current_words = [word]
+                current_width = word_width
         
-        if current_line:
-            lines.append(current_line)
+        if current_words:
+            lines.append(" ".join(current_words))
         
         return lines
 
     def _draw_multiline_text(self, draw: ImageDraw.Draw, lines: List[str], 
-                           width: int, height: int, font: Any) -> None:
+                           width: int, height: int, font: Any, draw_text: Callable[..., None]) -> None:
         line_height = font.size + 4
         total_height = len(lines) * line_height
         y_start = (height - total_height) // 2
         
-        border_width = 2
         for i, line in enumerate(lines):
-            line_width = font.getlength(line)
+            line_width = _text_width(font, line)
             x_pos = (width - line_width) // 2
             y_pos = y_start + i * line_height
-            
-            for dx in [-border_width, 0, border_width]:
-                for dy in [-border_width, 0, border_width]:
-                    if dx != 0 or dy != 0:
-                        draw.text((x_pos+dx, y_pos+dy), line, fill='black', font=font)
-            
-            draw.text((x_pos, y_pos), line, fill='white', font=font)
+            draw_text(draw, (x_pos, y_pos), line, font)
 
     def _draw_single_line_text(self, draw: ImageDraw.Draw, text: str, 
-                             width: int, height: int, font: Any, text_width: float) -> None:
+                             width: int, height: int, font: Any, text_width: float,
+                             draw_text: Callable[..., None]) -> None:
         x_pos = (width - text_width) // 2
         y_pos = (height - font.size) // 2
+        draw_text(draw, (x_pos, y_pos), text, font)
+
+    def ingest_ballots(self, source: Any) -> int:
+        """Validate and append ranked ballots from an iterable, a BallotArchive or a CSV/JSONL/.jaxb file.
+
+        Each ballot lists games best-first, by name or (as JSON integers) by
+        index into ``games``; names not yet on the slate are added to it.
+        JSONL lines may also be objects of the form ``{"voter": ..., "ranking": [...]}``.
+        Files are read one line at a time; a .jaxb archive loaded into an
+        empty model is memory-mapped rather than read. Nothing is changed
+        unless every ballot is valid. Returns the number of ballots added.
+        """
+        if isinstance(source, (str, os.PathLike)) and os.fspath(source).lower().endswith(BallotArchive.EXTENSION):
+            source = BallotArchive.open(os.fspath(source))
+        if isinstance(source, BallotArchive):
+            archive = source
+            if not self.games and not self.votes:
+                # Take the mapped ballots as they are: the tally engines read them without a copy
+                for game in archive.games:
+                    self._register_game(game)
+                self.votes = archive.votes
+                self.voter_names = []
+                self.num_voters = len(self.votes)
+                return self.num_voters
+            games = archive.games
+            return self.ingest_ballots([games[game_id] for game_id in ballot] for ballot in archive.votes)
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, newline='', encoding='utf-8') as f:
+                return self.ingest_ballots(self._read_ballot_rows(f, os.fspath(source)))
+        
+        # Validate everything into staging first, so a bad row leaves the model untouched
+        staged_votes = BallotStore()
+        staged_voters: List[Optional[str]] = []
+        new_games: Dict[str, int] = {}
+        for row in source:
+            voter = None
+            if isinstance(row, dict):
+                if row.get("voter") is not None:
+                    voter = str(row["voter"])
+                row = row.get("ranking", [])
+            staged_votes.append(self._validate_ballot(row, len(self.votes) + len(staged_votes) + 1, new_games))
+            staged_voters.append(voter)
+        
+        for game in new_games:  # in first-seen order, so the provisional ids hold
+            self._register_game(game)
+        if not isinstance(self.votes, BallotStore):
+            self.votes = BallotStore(self.votes)
+        if not self.votes:
+            # Imported elections bring their own voters (if any)
+            self.voter_names = []
+        else:
+            # Ballots added before any names are anonymous, keeping the names positional
+            self.voter_names.extend([None] * (len(self.votes) - len(self.voter_names)))
+        self.votes.extend(staged_votes)
+        self.voter_names.extend(staged_voters)
         
-        border_width = 2
-        for dx in [-border_width, 0, border_width]:
-            for dy in [-border_width, 0, border_width]:
-                if dx != 0 or dy != 0:
-                    draw.text((x_pos+dx, y_pos+dy), text, fill='black', font=font)
+        self.num_voters = len(self.votes)
+        return len(staged_votes)
+
+    def _read_ballot_rows(self, f: Any, path: str) -> Iterator[Any]:
+        if path.lower().endswith(('.jsonl', '.ndjson')):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            for row in csv.reader(f):
+                cells = [cell.strip() for cell in row if cell.strip()]
+                if cells:
+                    yield cells
+
+    def _validate_ballot(self, row: Any, ballot_number: int, new_games: Dict[str, int]) -> List[int]:
+        """Resolve a ballot to game ids; unseen names get provisional ids in ``new_games``"""
+        if not isinstance(row, (list, tuple)) or not row:
+            raise ValueError(f"Ballot {ballot_number}: expected a non-empty list of ranked games")
+        
+        num_games = len(self.games) + len(new_games)
+        ballot = []
+        for entry in row:
+            if isinstance(entry, int) and not isinstance(entry, bool):
+                game_id = entry
+            elif not isinstance(entry, str):
+                raise ValueError(f"Ballot {ballot_number}: expected a game name or index, got {entry!r}")
+            else:
+                # Strings are always names, so a game called "2048" is not read as an index
+                name = entry.strip()
+                game_id = self.game_ids.get(name, new_games.get(name))
+                if game_id is None:
+                    if not name or num_games >= BallotStore.MAX_GAMES:
+                        raise ValueError(f"Ballot {ballot_number}: cannot add game {name!r}")
+                    game_id = new_games[name] = num_games
+                    num_games += 1
+            
+            if not 0 <= game_id < num_games:
+                raise ValueError(f"Ballot {ballot_number}: game index {game_id} is out of range")
+            if game_id in ballot:
+                raise ValueError(f"Ballot {ballot_number}: {entry!r} is ranked more than once")
+            ballot.append(game_id)
         
-        draw.text((x_pos, y_pos), text, fill='white', font=font)
+        return ballot
 
     def calculate_jax_method_voting(self) -> Tuple[Optional[str], Dict[str, Any]]:
+        # Every outcome is kept on the model, so save_results sees majority wins and errors too
+        self.winner, self.round_results = self._run_jax_method()
+        return self.winner, self.round_results
+
+    def _run_jax_method(self) -> Tuple[Optional[str], Dict[str, Any]]:
         if not self.games:
             return None, {"error": "No games to evaluate", "round": 0}
         
@@ -174,69 +1179,59 @@ class JaxVotingSystem:
             "rounds": []
         }
         
-        # Convert vote indices to game names
-        vote_ballots = [[self.games[idx] for idx in vote] for vote in self.votes]
+        # Initialize points for each ballot and the running per-game totals
+        engine = self._create_tally_engine()
         
-        # Initialize points for each ballot
-        ballot_points = []
-        points_debug_info = []
-        
-        for i, vote in enumerate(vote_ballots):
-            ballot_dict = {}
-            points_desc = []
-            for j, game in enumerate(vote):
-                points = len(vote) - j  # Top rank gets highest points
-                ballot_dict[game] = points
-                points_desc.append(f"{game}:{points}")
-            ballot_points.append(ballot_dict)
-            points_debug_info.append(f"Ballot {i+1}: {', '.join(points_desc)}")
-        
-        round_results["metadata"]["initial_points_distribution"] = points_debug_info
+        round_results["metadata"]["initial_points_distribution"] = InitialPointsDistribution(self.games, self.votes)
         
         # Active games (not eliminated)
         active_games = set(self.games)
         round_num = 1
         
         while len(active_games) > 3:
-            round_info = self._process_round(round_num, active_games, ballot_points, vote_ballots)
+            round_info = self._process_round(round_num, active_games, engine)
             round_results["rounds"].append(round_info)
             
             # Check if we have a winner with >50% of total points
-            total_points = sum(round_info["game_totals"].values())
-            for game, points in round_info["game_totals"].items():
-                if points > total_points * 0.51:
-                    round_results["winner"] = game
-                    round_results["podium"] = [{"position": 1, "game": game, "score": points}]
-                    return game, round_results
+            majority_id = engine.majority_id()
+            if majority_id is not None:
+                game = self.games[majority_id]
+                round_results["winner"] = game
+                round_results["podium"] = [{"position": 1, "game": game, "score": round_info["game_totals"][game]}]
+                return game, round_results
             
             # Eliminate the lowest scoring game
             eliminated_game = round_info["eliminated"]
             active_games.remove(eliminated_game)
             
             # Redistribute points for the eliminated game
-            self._redistribute_points(eliminated_game, active_games, ballot_points, vote_ballots)
+            engine.eliminate(self.game_ids[eliminated_game])
             
             round_num += 1
         
         # Final round with 3 or fewer games
-        final_round = self._process_final_round(round_num, active_games, ballot_points)
+        final_round = self._process_final_round(round_num, active_games, engine)
         round_results["rounds"].append(final_round)
         round_results["podium"] = final_round["podium"]
         round_results["winner"] = final_round["podium"][0]["game"]
         
-        self.winner = round_results["winner"]
-        self.round_results = round_results
-        
         return round_results["winner"], round_results
 
-    def _process_round(self, round_num: int, active_games: set, ballot_points: List[Dict[str, float]], 
-                      vote_ballots: List[List[str]]) -> Dict[str, Any]:
-        # Calculate current totals for each game
-        game_totals = {game: 0.0 for game in active_games}
-        for ballot in ballot_points:
-            for game, points in ballot.items():
-                if game in active_games:
-                    game_totals[game] += points
+    def _create_tally_engine(self) -> BaseTallyEngine:
+        if self.tally_backend == "numpy":
+            if not _load_numpy():
+                raise RuntimeError("The 'numpy' tally backend requires NumPy to be installed")
+            return NumpyTallyEngine(len(self.games), self.votes)
+        if self.tally_backend == "python":
+            return ArrayTallyEngine(len(self.games), self.votes)
+        raise ValueError(f"Unknown tally backend: {self.tally_backend!r}")
+
+    def _current_totals(self, engine: BaseTallyEngine) -> Dict[str, float]:
+        return {self.games[game_id]: float(engine.totals[game_id]) for game_id in engine.active_ids()}
+
+    def _process_round(self, round_num: int, active_games: set, engine: BaseTallyEngine) -> Dict[str, Any]:
+        # Read the running totals for each active game
+        game_totals = self._current_totals(engine)
         
         # Check for tie at the bottom
         min_score = min(game_totals.values())
@@ -244,7 +1239,8 @@ class JaxVotingSystem:
         
         # Break tie if necessary
         if len(eliminated_candidates) > 1:
-            eliminated_game = self._break_tie(eliminated_candidates, vote_ballots, active_games)
+            candidate_ids = [self.game_ids[game] for game in eliminated_candidates]
+            eliminated_game = self.games[engine.break_tie(candidate_ids)]
         else:
             eliminated_game = eliminated_candidates[0]
         
@@ -260,13 +1256,9 @@ class JaxVotingSystem:
             "active_games": list(active_games)
         }
 
-    def _process_final_round(self, round_num: int, active_games: set, ballot_points: List[Dict[str, float]]) -> Dict[str, Any]:
-        # Calculate final totals
-        game_totals = {game: 0.0 for game in active_games}
-        for ballot in ballot_points:
-            for game, points in ballot.items():
-                if game in active_games:
-                    game_totals[game] += points
+    def _process_final_round(self, round_num: int, active_games: set, engine: BaseTallyEngine) -> Dict[str, Any]:
+        # Read final totals
+        game_totals = self._current_totals(engine)
         
         # Create podium ranking
         sorted_games = sorted(game_totals.items(), key=lambda x: x[1], reverse=True)
@@ -281,209 +1273,144 @@ class JaxVotingSystem:
             "active_games": list(active_games)
         }
 
-    def _redistribute_points(self, eliminated_game: str, active_games: set, 
-                            ballot_points: List[Dict[str, float]], vote_ballots: List[List[str]]):
-        for i, ballot in enumerate(ballot_points):
-            if eliminated_game not in ballot:
-                continue
-                
-            # Get the points to redistribute
-            points_pool = ballot[eliminated_game]
-            del ballot[eliminated_game]
-            
-            # Find the remaining games in this ballot in order
-            ballot_order = vote_ballots[i]
-            remaining_in_ballot = [game for game in ballot_order if game in active_games and game != eliminated_game]
-            
-            # Redistribute points with 50% cascade
-            for game in remaining_in_ballot:
-                allocation = points_pool * 0.5
-                ballot[game] = ballot.get(game, 0) + allocation
-                points_pool -= allocation
-                
-                if points_pool < 0.001:  # negligible amount
-                    break
-
-    def _break_tie(self, candidates: List[str], vote_ballots: List[List[str]], active_games: set) -> str:
-        # Count last place votes for each candidate
-        last_place_counts = {candidate: 0 for candidate in candidates}
-        
-        for ballot in vote_ballots:
-            # Find the active game with the worst rank in this ballot
-            worst_rank = -1
-            worst_game = None
-            
-            for rank, game in enumerate(ballot):
-                if game in candidates and game in active_games:
-                    if rank > worst_rank:
-                        worst_rank = rank
-                        worst_game = game
-            
-            if worst_game:
-                last_place_counts[worst_game] += 1
-        
-        # Find candidate with most last place votes
-        max_last_place = max(last_place_counts.values())
-        worst_candidates = [c for c in candidates if last_place_counts[c] == max_last_place]
-        
-        if len(worst_candidates) == 1:
-            return worst_candidates[0]
-        
-        # If still tied, check second-to-last place votes, etc.
-        return self._break_tie_deep(worst_candidates, vote_ballots, active_games, 1)
-    
-    def _break_tie_deep(self, candidates: List[str], vote_ballots: List[List[str]], 
-                       active_games: set, depth: int) -> str:
-        if len(candidates) == 1:
-            return candidates[0]
-        
-        # Count nth worst place votes (depth = 1 means second worst, etc.)
-        place_counts = {candidate: 0 for candidate in candidates}
-        
-        for ballot in vote_ballots:
-            # Get all active candidate positions in this ballot
-            candidate_positions = []
-            for rank, game in enumerate(ballot):
-                if game in candidates and game in active_games:
-                    candidate_positions.append((rank, game))
-            
-            # Sort by rank (worst first)
-            candidate_positions.sort(reverse=True)
-            
-            # Count the depth-th worst candidate
-            if len(candidate_positions) > depth:
-                _, worst_game = candidate_positions[depth]
-                place_counts[worst_game] += 1
-        
-        # Find candidate with most votes at this depth
-        max_count = max(place_counts.values())
-        worst_candidates = [c for c in candidates if place_counts[c] == max_count]
-        
-        if len(worst_candidates) == 1:
-            return worst_candidates[0]
-        
-        # If still tied, go deeper
-        if depth < len(candidates):
-            return self._break_tie_deep(worst_candidates, vote_ballots, active_games, depth + 1)
-        
-        # If all else fails, random choice
-        return random.choice(candidates)
-
-    def save_results(self) -> Optional[str]:
-        results_dir = "voting_results"
+    def save_results(self, results_dir: str = "voting_results") -> Optional[str]:
         if not os.path.exists(results_dir):
             os.makedirs(results_dir)
         
         if not hasattr(self, 'round_results') or not self.round_results:
             return None
         
-        # Extract rounds and metadata from the new structure
+        text, csv_text = self.render_results()
+        
+        # Saving the same results again (e.g. the Save button after the automatic save)
+        # just points at the files already written
+        digest = hashlib.sha256(f"{results_dir}\0{text}\0{csv_text}".encode("utf-8")).hexdigest()
+        if self._saved_results and self._saved_results[0] == digest and os.path.exists(self._saved_results[1]):
+            return self._saved_results[1]
+        
+        saved_at = datetime.now()
+        stem = self._claim_results_stem(results_dir, saved_at)
+        text_filename = f"{stem}.txt"
+        csv_filename = f"{stem}.csv"
+        archive_filename = f"{stem}{BallotArchive.EXTENSION}"
+        
+        # A failed tally (no games or no votes) gets its report, but is no election to archive
+        is_election = "error" not in self.round_results
+        try:
+            if is_election:
+                _write_atomic(archive_filename, BallotArchive.encode(self.games, self.votes, 
+                                                                     self.round_results.get('rounds', [])))
+            _write_atomic(csv_filename, csv_text, newline='')
+            _write_atomic(text_filename, text)
+        except BaseException:
+            # Don't leave the empty placeholder claiming the name
+            if os.path.exists(text_filename) and not os.path.getsize(text_filename):
+                os.remove(text_filename)
+            raise
+        if is_election:
+            HistoryStore(os.path.join(results_dir, HistoryStore.FILENAME)).record(self, saved_at, text_filename)
+        self._saved_results = (digest, text_filename)
+        
+        return text_filename
+
+    @staticmethod
+    def _claim_results_stem(results_dir: str, saved_at: datetime) -> str:
+        """Reserve a results file name, adding _2, _3, ... when a save already used this second"""
+        stem = os.path.join(results_dir, f"jax_method_results_{saved_at.strftime('%Y%m%d_%H%M%S')}")
+        for attempt in itertools.count(1):
+            candidate = stem if attempt == 1 else f"{stem}_{attempt}"
+            try:
+                # O_EXCL makes the claim atomic across threads and processes sharing the folder
+                os.close(os.open(f"{candidate}.txt", os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+            except FileExistsError:
+                continue
+            return candidate
+
+    def render_results(self) -> Tuple[str, str]:
+        """Render the txt report and the per-round csv table in one pass over the rounds"""
         rounds = self.round_results.get('rounds', [])
         metadata = self.round_results.get('metadata', {})
+        total_games = metadata.get('total_games', 0)
+        
+        lines: List[str] = []
+        if metadata:
+            lines.append("VOTING RESULTS METADATA")
+            lines.append("=" * 50)
+            lines.append(f"Total Games: {metadata.get('total_games', 'N/A')}")
+            lines.append(f"Total Votes: {metadata.get('total_votes', 'N/A')}")
+            lines.append(f"Method: {metadata.get('method', 'N/A')}\n")
+            
+            if 'initial_points_distribution' in metadata:
+                lines.append("Initial Points Distribution:")
+                lines.append("-" * 30)
+                lines.extend(map(str, metadata['initial_points_distribution']))
+                lines.append("")
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        text_filename = os.path.join(results_dir, f"jax_method_results_{timestamp}.txt")
-        csv_filename = os.path.join(results_dir, f"jax_method_results_{timestamp}.csv")
-        
-        with open(text_filename, 'w', encoding='utf-8') as f:
-            if metadata:
-                f.write("VOTING RESULTS METADATA\n")
-                f.write("=" * 50 + "\n")
-                f.write(f"Total Games: {metadata.get('total_games', 'N/A')}\n")
-                f.write(f"Total Votes: {metadata.get('total_votes', 'N/A')}\n")
-                f.write(f"Method: {metadata.get('method', 'N/A')}\n\n")
-                
-                if 'initial_points_distribution' in metadata:
-                    f.write("Initial Points Distribution:\n")
-                    f.write("-" * 30 + "\n")
-                    for line in metadata['initial_points_distribution']:
-                        f.write(f"{line}\n")
-                    f.write("\n")
+        lines.append("JAX METHOD VOTING RESULTS")
+        lines.append("=" * 50 + "\n")
+        
+        # Per-game csv cells filled in while the rounds are walked for the report
+        csv_table: Dict[str, List[Any]] = {}
+        
+        for round_index, round_data in enumerate(rounds):
+            lines.append(f"ROUND {round_data['round']}")
+            lines.append("-" * 20)
             
-            f.write("JAX METHOD VOTING RESULTS\n")
-            f.write("=" * 50 + "\n\n")
+            game_totals = round_data.get('game_totals', {})
+            percentages = round_data.get('percentages', {})
+            instant_winner = None
             
-            for round_data in rounds:
-                f.write(f"ROUND {round_data['round']}\n")
-                f.write("-" * 20 + "\n")
-                
-                # Write game totals in descending order
-                sorted_games = sorted(round_data['game_totals'].items(), 
-                                     key=lambda x: x[1], reverse=True)
-                for game, score in sorted_games:
-                    percentage = round_data.get('percentages', {}).get(game, 0)
-                    f.write(f"{game}: {score:.2f} points ({percentage:.1f}%)\n")
-                
-                # Calculate and write total points
-                total_points = sum(round_data['game_totals'].values())
-                f.write(f"Total Points: {total_points:.2f}\n")
-                
-                # Write eliminated game
-                if 'eliminated' in round_data:
-                    f.write(f"Eliminated: {round_data['eliminated']}\n")
-                
-                # Write active games count
-                active_count = len(round_data.get('active_games', []))
-                total_games = metadata.get('total_games', 0)
-                progress_percent = ((total_games - active_count) / total_games * 100) if total_games > 0 else 0
-                f.write(f"Progress: {total_games - active_count}/{total_games} ({progress_percent:.1f}%)\n")
-                
-                # Check for 51% winner
-                for game, percentage in round_data.get('percentages', {}).items():
-                    if percentage > 50:
-                        f.write(f"INSTANT WINNER: {game} with {percentage:.1f}% of votes\n")
-                        break
-                
-                f.write("\n")
+            # Write game totals in descending order
+            for game, score in sorted(game_totals.items(), key=lambda x: x[1], reverse=True):
+                percentage = percentages.get(game, 0)
+                lines.append(f"{game}: {score:.2f} points ({percentage:.1f}%)")
+                row = csv_table.get(game)
+                if row is None:
+                    row = csv_table[game] = [''] * len(rounds)  # empty once eliminated
+                row[round_index] = round(score, 2)
             
-            f.write("FINAL RESULT\n")
-            f.write("=" * 50 + "\n")
+            for game, percentage in percentages.items():
+                if percentage > 50:
+                    instant_winner = (game, percentage)
+                    break
             
-            # Write podium results
-            if 'podium' in self.round_results:
-                podium = self.round_results['podium']
-                f.write("Olympic-Style Podium Results:\n")
-                f.write("-" * 30 + "\n")
-                for entry in podium:
-                    position_suffix = "st" if entry['position'] == 1 else "nd" if entry['position'] == 2 else "rd"
-                    f.write(f"{entry['position']}{position_suffix}: {entry['game']} ({entry['score']:.2f} points)\n")
-                f.write(f"\nOverall Winner: {self.winner}\n")
-            elif self.winner:
-                f.write(f"Winner: {self.winner}\n")
-            else:
-                f.write("No winner determined.\n")
-
-        self._save_results_csv(csv_filename, rounds)
+            lines.append(f"Total Points: {sum(game_totals.values()):.2f}")
+            
+            if 'eliminated' in round_data:
+                lines.append(f"Eliminated: {round_data['eliminated']}")
+            
+            active_count = len(round_data.get('active_games', []))
+            progress_percent = ((total_games - active_count) / total_games * 100) if total_games > 0 else 0
+            lines.append(f"Progress: {total_games - active_count}/{total_games} ({progress_percent:.1f}%)")
+            
+            if instant_winner:
+                lines.append(f"INSTANT WINNER: {instant_winner[0]} with {instant_winner[1]:.1f}% of votes")
+            
+            lines.append("")
         
-        return text_filename
-    def _save_results_csv(self, filename: str, rounds: List[Dict[str, Any]]) -> None:
-        # Get all unique games across all rounds
-        all_games = set()
-        for round_data in rounds:
-            if 'game_totals' in round_data:
-                all_games.update(round_data['game_totals'].keys())
+        lines.append("FINAL RESULT")
+        lines.append("=" * 50)
         
-        all_games = sorted(all_games)  # Sort for consistent ordering
+        if 'podium' in self.round_results:
+            lines.append("Olympic-Style Podium Results:")
+            lines.append("-" * 30)
+            for entry in self.round_results['podium']:
+                position_suffix = "st" if entry['position'] == 1 else "nd" if entry['position'] == 2 else "rd"
+                lines.append(f"{entry['position']}{position_suffix}: {entry['game']} ({entry['score']:.2f} points)")
+            lines.append(f"\nOverall Winner: {self.winner}")
+        elif self.winner:
+            lines.append(f"Winner: {self.winner}")
+        else:
+            lines.append("No winner determined.")
+        lines.append("")
         
-        # Create header row
-        headers = ['Game'] + [f'Round {i+1}' for i in range(len(rounds))]
+        csv_buffer = io.StringIO()
+        writer = csv.writer(csv_buffer)
+        writer.writerow(['Game'] + [f'Round {i+1}' for i in range(len(rounds))])
+        for game in sorted(csv_table):  # Sort for consistent ordering
+            writer.writerow([game] + csv_table[game])
         
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-            
-            # Create a row for each game
-            for game in all_games:
-                row = [game]
-                
-                # Add values for each round
-                for round_data in rounds:
-                    if 'game_totals' in round_data and game in round_data['game_totals']:
-                        row.append(round(round_data['game_totals'][game], 2))
-                    else:
-                        row.append('')  # Empty cell if game was eliminated
-                        
-                writer.writerow(row)
+        return "\n".join(lines), csv_buffer.getvalue()
 
 # View Classes
 class BaseView:
@@ -510,19 +1437,19 @@ class SuggestionView(BaseView):
     def create_widgets(self) -> None:
         Label(self.frame, 
              text="Enter Game Suggestions (Max 15)", 
-             font=('Arial', self.controller.get_scaled_font_size(20))).pack(pady=(20, 10))
+             font=self.controller.get_scaled_font(20)).pack(pady=(20, 10))
         
         input_frame = Frame(self.frame)
         input_frame.pack(pady=10)
         
         self.game_entry = Entry(input_frame, width=30, 
-                              font=('Arial', self.controller.get_scaled_font_size(14)))
+                              font=self.controller.get_scaled_font(14))
         self.game_entry.pack(side=LEFT, padx=5)
         self.game_entry.bind('<Return>', lambda event: self.controller.add_game(self.game_entry.get().strip().title()))
         self.game_entry.focus_set()
         
         self.suggest_button = Button(input_frame, text="Add Game", 
-                                   font=('Arial', self.controller.get_scaled_font_size(14)), 
+                                   font=self.controller.get_scaled_font(14), 
                                    command=lambda: self.controller.add_game(self.game_entry.get().strip().title()))
         self.suggest_button.pack(side=LEFT, padx=5)
         
@@ -535,7 +1462,7 @@ class SuggestionView(BaseView):
         self.game_listbox = Listbox(list_frame, 
                                   width=40,
                                   height=15,
-                                  font=('Arial', self.controller.get_scaled_font_size(12)),
+                                  font=self.controller.get_scaled_font(12),
                                   yscrollcommand=scrollbar.set)
         self.game_listbox.pack(side=LEFT, fill=BOTH, expand=True)
         scrollbar.config(command=self.game_listbox.yview)
@@ -544,7 +1471,7 @@ class SuggestionView(BaseView):
         
         Button(self.frame, 
               text="Done", 
-              font=('Arial', self.controller.get_scaled_font_size(16)),
+              font=self.controller.get_scaled_font(16),
               command=self.controller.start_voting_phase).pack(pady=20)
     
     def on_remove_game(self, event: Any) -> None:
@@ -565,6 +1492,29 @@ class SuggestionView(BaseView):
             self.game_entry.focus_set()
 
 
+class SlotHitIndex:
+    """Slot rectangles in screen coordinates, bucketed into columns for one-lookup hit tests"""
+    def __init__(self, rects: List[Tuple[int, int, int, int, Any]]):
+        columns: Dict[int, List[Tuple[int, int, int, Any]]] = defaultdict(list)
+        for x0, y0, x1, y1, slot in rects:
+            columns[x0].append((y0, y1, x1, slot))
+        
+        self.column_starts: List[int] = sorted(columns)
+        self.rows: List[List[Tuple[int, int, int, Any]]] = [sorted(columns[x0], key=lambda r: r[0]) 
+                                                            for x0 in self.column_starts]
+        self.row_starts: List[List[int]] = [[row[0] for row in rows] for rows in self.rows]
+
+    def slot_at(self, x: int, y: int) -> Optional[Any]:
+        column = bisect.bisect_right(self.column_starts, x) - 1
+        if column < 0:
+            return None
+        row = bisect.bisect_right(self.row_starts[column], y) - 1
+        if row < 0:
+            return None
+        y0, y1, x1, slot = self.rows[column][row]
+        return slot if y <= y1 and x <= x1 else None
+
+
 class VotingView(BaseView):
     def __init__(self, root: Tk, controller: Any):
         super().__init__(root, controller)
@@ -578,15 +1528,30 @@ class VotingView(BaseView):
         self.floating_label: Optional[Label] = None
         self.game_pool_container: Optional[Frame] = None
         self.ranking_container: Optional[Frame] = None
+        self.voter_label: Optional[Label] = None
+        self.built_games: List[str] = []
+        self.slot_index: Optional[SlotHitIndex] = None  # rebuilt lazily after layout changes
+        self.highlighted_slot: Optional[Label] = None
+        # Latest pointer position not yet drawn, with when the first coalesced event arrived
+        self.pending_motion: Optional[Tuple[int, int]] = None
+        self.pending_since: float = 0.0
+        self.pending_events: int = 0
+        self.motion_after_id: Optional[str] = None
+        self.drag_samples: List[Tuple[float, int]] = []  # (latency ms, events coalesced) per frame
         
     def create_widgets(self, voter_name: str, games: List[str]) -> None:
-        Label(self.frame, 
-             text=f"{voter_name}'s Vote", 
-             font=('Arial', self.controller.get_scaled_font_size(20))).pack(pady=(10, 20))
+        # Clear widgets left over from a previous voting session
+        for widget in self.frame.winfo_children():
+            widget.destroy()
+        
+        self.voter_label = Label(self.frame, 
+                                 text=f"{voter_name}'s Vote", 
+                                 font=self.controller.get_scaled_font(20))
+        self.voter_label.pack(pady=(10, 20))
         
         Label(self.frame, 
              text="Drag games to rank them from best (1) to worst", 
-             font=('Arial', self.controller.get_scaled_font_size(14))).pack(pady=(0, 10))
+             font=self.controller.get_scaled_font(14)).pack(pady=(0, 10))
         
         panels_frame = Frame(self.frame)
         panels_frame.pack(fill=BOTH, expand=True, pady=20)
@@ -596,7 +1561,7 @@ class VotingView(BaseView):
         
         Label(left_panel, 
              text="Game Pool (Drag to rank)", 
-             font=('Arial', self.controller.get_scaled_font_size(14))).pack(pady=(10, 5))
+             font=self.controller.get_scaled_font(14)).pack(pady=(10, 5))
         
         self.game_pool_container = Frame(left_panel, height=250, width=800)
         self.game_pool_container.pack_propagate(False)
@@ -607,7 +1572,7 @@ class VotingView(BaseView):
         
         Label(right_panel, 
              text="Your Ranking (1 = Best)", 
-             font=('Arial', self.controller.get_scaled_font_size(14))).pack(pady=(10, 5))
+             font=self.controller.get_scaled_font(14)).pack(pady=(10, 5))
         
         self.ranking_container = Frame(right_panel, height=250, width=800)
         self.ranking_container.pack_propagate(False)
@@ -615,10 +1580,45 @@ class VotingView(BaseView):
         
         Button(self.frame, 
               text="Submit Vote", 
-              font=('Arial', self.controller.get_scaled_font_size(14)),
+              font=self.controller.get_scaled_font(14),
               command=self.controller.submit_vote).pack(pady=20)
         
         self.setup_drag_drop_interface(games)
+        self.built_games = games[:]
+    
+    def reset_for_voter(self, voter_name: str, games: List[str]) -> None:
+        """Hand the existing widgets to the next voter: new title, empty slots, reshuffled pool"""
+        if games != self.built_games:
+            self.create_widgets(voter_name, games)
+            return
+        
+        self.voter_label.config(text=f"{voter_name}'s Vote")
+        
+        self.cancel_drag_motion()
+        if self.floating_label:
+            self.floating_label.destroy()
+            self.floating_label = None
+        if self.placeholder:
+            self.placeholder.destroy()
+            self.placeholder = None
+        self.dragged_widget = None
+        self.set_highlighted_slot(None)
+        
+        for slot in self.slot_widgets:
+            if slot.game_name:
+                slot.config(text='', bg='SystemButtonFace')
+                slot.game_name = None
+        
+        # Re-grid the existing pool cells in a fresh random order
+        max_per_row = 5
+        shuffled_labels = self.draggable_labels[:]
+        random.shuffle(shuffled_labels)
+        for i, lbl in enumerate(shuffled_labels):
+            position = (i // max_per_row, i % max_per_row)
+            self.original_positions[lbl.game_name] = position
+            lbl.master.grid(row=position[0], column=position[1])
+            if not lbl.winfo_manager():
+                lbl.pack(expand=True, fill=BOTH)
     
     def setup_drag_drop_interface(self, games: List[str]) -> None:
         for widget in self.game_pool_container.winfo_children():
@@ -657,6 +1657,8 @@ class VotingView(BaseView):
             self.draggable_labels.append(lbl)
         
         self.slot_widgets = []
+        self.slot_index = None
+        self.highlighted_slot = None
         
         num_rows = (len(games) + 2) // 3
         
@@ -690,8 +1692,34 @@ class VotingView(BaseView):
             slot.game_name = None
             slot.slot_index = i
             slot.bind('<Button-1>', self.on_slot_click)
+            slot.bind('<Configure>', self.invalidate_slot_index)
             self.slot_widgets.append(slot)
     
+    def on_resize(self) -> None:
+        # The root window moved or resized, so cached screen coordinates are stale
+        self.invalidate_slot_index()
+    
+    def invalidate_slot_index(self, event: Any = None) -> None:
+        self.slot_index = None
+    
+    def get_slot_index(self) -> SlotHitIndex:
+        if self.slot_index is None:
+            rects = []
+            for slot in self.slot_widgets:
+                x0, y0 = slot.winfo_rootx(), slot.winfo_rooty()
+                rects.append((x0, y0, x0 + slot.winfo_width(), y0 + slot.winfo_height(), slot))
+            self.slot_index = SlotHitIndex(rects)
+        return self.slot_index
+    
+    def set_highlighted_slot(self, slot: Optional[Label]) -> None:
+        if slot is self.highlighted_slot:
+            return
+        if self.highlighted_slot is not None:
+            self.highlighted_slot.config(relief=RAISED)
+        if slot is not None:
+            slot.config(relief=SUNKEN)
+        self.highlighted_slot = slot
+    
     def on_drag_start(self, event: Any) -> None:
         self.dragged_widget = event.widget
         
@@ -715,43 +1743,67 @@ class VotingView(BaseView):
         self.floating_label.image = self.dragged_widget.image
         self.floating_label.place(x=event.x_root, y=event.y_root)
         self.floating_label.lift()
+        self.drag_samples = []
         
     def on_drag_motion(self, event: Any) -> None:
-        if self.floating_label:
-            x = event.x_root - self.drag_start_x
-            y = event.y_root - self.drag_start_y
-            self.floating_label.place(x=x, y=y)
+        # Only remember the newest position; it is drawn once per frame by apply_drag_motion
+        if not self.floating_label:
+            return
+        if self.pending_motion is None:
+            self.pending_since = time.perf_counter()
+            self.pending_events = 0
+        self.pending_motion = (event.x_root, event.y_root)
+        self.pending_events += 1
+        if self.motion_after_id is None:
+            self.motion_after_id = self.root.after(DRAG_FRAME_MS, self.apply_drag_motion)
+    
+    def apply_drag_motion(self) -> None:
+        self.motion_after_id = None
+        if not self.floating_label or self.pending_motion is None:
+            return
+        x_root, y_root = self.pending_motion
+        self.pending_motion = None
+        self.floating_label.place(x=x_root - self.drag_start_x, y=y_root - self.drag_start_y)
+        self.set_highlighted_slot(self.get_slot_index().slot_at(x_root, y_root))
+        self.drag_samples.append(((time.perf_counter() - self.pending_since) * 1000, self.pending_events))
+    
+    def cancel_drag_motion(self) -> None:
+        if self.motion_after_id is not None:
+            self.root.after_cancel(self.motion_after_id)
+            self.motion_after_id = None
+        self.pending_motion = None
 
     def on_drag_end(self, event: Any) -> None:
         if not self.dragged_widget:
             return
+        
+        self.cancel_drag_motion()
+        if self.controller.drag_latency_hook and self.drag_samples:
+            self.controller.drag_latency_hook(self.drag_samples)
             
         if self.floating_label:
             self.floating_label.place_forget()
             self.floating_label.destroy()
             self.floating_label = None
                 
+        self.set_highlighted_slot(None)
+        
         dropped_on_slot = False
-        for slot in self.slot_widgets:
-            if (event.x_root >= slot.winfo_rootx() and 
-                event.x_root <= slot.winfo_rootx() + slot.winfo_width() and
-                event.y_root >= slot.winfo_rooty() and 
-                event.y_root <= slot.winfo_rooty() + slot.winfo_height()):
-                
-                dropped_on_slot = True
-                if slot.game_name:
-                    old_game = slot.game_name
-                    self.controller.return_game_to_pool(old_game, self.original_positions[old_game])
-                    
-                self.controller.place_game_in_slot(
-                    self.dragged_widget.game_name, 
-                    slot.slot_index,
-                    slot
-                )
+        slot = self.get_slot_index().slot_at(event.x_root, event.y_root)
+        if slot is not None:
+            dropped_on_slot = True
+            if slot.game_name:
+                old_game = slot.game_name
+                self.controller.return_game_to_pool(old_game, self.original_positions[old_game])
                 
-                if self.placeholder:
-                    self.placeholder.destroy()
-                break
+            self.controller.place_game_in_slot(
+                self.dragged_widget.game_name, 
+                slot.slot_index,
+                slot
+            )
+            
+            if self.placeholder:
+                self.placeholder.destroy()
         
         if not dropped_on_slot and self.placeholder:
             self.placeholder.destroy()
@@ -783,16 +1835,315 @@ class VotingView(BaseView):
                 break
 
 
+def _ease_out_cubic(progress: float) -> float:
+    return 1 - (1 - progress) ** 3
+
+
+class Tween:
+    """One time-based animation driven by AnimationScheduler"""
+    __slots__ = ("start", "duration", "on_step", "on_done", "easing")
+    
+    def __init__(self, start: float, duration: float, on_step: Callable[[float], None],
+                 on_done: Optional[Callable[[], None]], easing: Callable[[float], float]):
+        self.start = start
+        self.duration = duration
+        self.on_step = on_step
+        self.on_done = on_done
+        self.easing = easing
+
+
+class AnimationScheduler:
+    """A single after() loop advancing every active tween from the wall clock.
+    
+    Progress is computed from elapsed time on each tick, so a slow machine shows
+    fewer frames rather than a slower animation, and only one tick is ever queued.
+    """
+    def __init__(self, root: Tk):
+        self.root = root
+        self.tweens: List[Tween] = []
+        self.after_id: Optional[str] = None
+
+    def tween(self, duration: float, on_step: Callable[[float], None], 
+              on_done: Optional[Callable[[], None]] = None, delay: float = 0.0,
+              easing: Callable[[float], float] = _ease_out_cubic) -> Tween:
+        """Call on_step(eased progress 0..1) every frame for duration seconds after delay"""
+        tween = Tween(time.perf_counter() + delay, duration, on_step, on_done, easing)
+        self.tweens.append(tween)
+        if self.after_id is None:
+            self.after_id = self.root.after(ANIMATION_FRAME_MS, self._tick)
+        return tween
+
+    def cancel(self, tween: Tween) -> None:
+        if tween in self.tweens:
+            self.tweens.remove(tween)
+
+    def cancel_all(self) -> None:
+        self.tweens.clear()
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+    def _tick(self) -> None:
+        self.after_id = None
+        now = time.perf_counter()
+        for tween in self.tweens[:]:
+            if tween not in self.tweens:
+                continue  # cancelled by an earlier callback in this tick
+            elapsed = now - tween.start
+            if elapsed < 0:
+                continue
+            progress = min(1.0, elapsed / tween.duration) if tween.duration > 0 else 1.0
+            tween.on_step(tween.easing(progress))
+            if progress >= 1.0:
+                self.cancel(tween)
+                if tween.on_done:
+                    tween.on_done()
+        
+        if self.tweens and self.after_id is None:
+            self.after_id = self.root.after(ANIMATION_FRAME_MS, self._tick)
+
+
+class SpriteCache:
+    """PhotoImages of the results artwork, rendered once per resolution bucket and reused"""
+    BUCKETS = (0.5, 0.75, 1.0, 1.5, 2.0)  # scale relative to a 1920x1080 canvas
+    
+    def __init__(self):
+        self.sprites: Dict[Tuple[Any, ...], ImageTk.PhotoImage] = {}
+
+    @classmethod
+    def bucket(cls, canvas_width: int, canvas_height: int) -> float:
+        scale = min(canvas_width / 1920, canvas_height / 1080)
+        return min(cls.BUCKETS, key=lambda b: abs(b - scale))
+
+    def get(self, key: Tuple[Any, ...], render: Callable[[], Image.Image]) -> ImageTk.PhotoImage:
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            _load_pil_modules()
+            sprite = self.sprites[key] = ImageTk.PhotoImage(render())
+        return sprite
+
+
+class RoundDisplay:
+    """What ResultsView shows for one elimination round, computed once per set of results"""
+    def __init__(self, round_data: Dict[str, Any], is_final: bool, 
+                 game_color: Callable[[str], str]):
+        totals = round_data['game_totals']
+        total_points = sum(totals.values())
+        max_score = max(totals.values()) if totals else 1
+        min_score = min(totals.values()) if totals else 0
+        
+        self.header = f"Round {round_data['round']}"
+        self.is_final = is_final
+        self.total_points = total_points
+        self.eliminated: Optional[str] = round_data.get('eliminated')
+        self.total_text = f"Total Points: {total_points:.1f}"
+        
+        # (game, score, percentage) and the drawn (game, color, bar fill fraction, label)
+        # rows, both from highest to lowest score
+        self.scores: List[Tuple[str, float, float]] = []
+        self.rows: List[Tuple[str, str, float, str]] = []
+        for game, score in sorted(totals.items(), key=lambda x: x[1], reverse=True):
+            percentage = (score / total_points * 100) if total_points > 0 else 0
+            fill_fraction = score / max_score if max_score > 0 else 0
+            self.scores.append((game, score, percentage))
+            self.rows.append((game, game_color(game), fill_fraction, 
+                              f"{game}: {score:.1f} points ({percentage:.1f}%)"))
+        self.row_of = {row[0]: i for i, row in enumerate(self.rows)}
+        
+        self.explanation = (f"{self.eliminated} was eliminated for having the lowest score "
+                            f"({min_score:.1f} points)")
+        self._wrapped: Dict[int, List[str]] = {}
+
+    def explanation_lines(self, max_width: int) -> List[str]:
+        char_width = 10  # pixels per character estimate
+        chars = max_width // char_width
+        if chars not in self._wrapped:
+            self._wrapped[chars] = ResultsView._wrap_text(self.explanation, chars * char_width, char_width)
+        return self._wrapped[chars]
+
+
+class DetailedResultsList:
+    """Canvas-drawn list of ballots and round results that only draws the visible rows.
+    
+    Ballots are addressed through a prefix array of row offsets, so even 100k ballots
+    cost two arrays rather than a Tk widget per ranked game.
+    """
+    ROW_HEIGHT = 30
+    FILTER_DELAY_MS = 200  # wait for a pause in typing before filtering
+    
+    # font, x indent, text color per row kind
+    ROW_STYLES = {
+        "title": (('Arial', 20, 'bold'), 10, 'black'),
+        "voter": (('Arial', 14, 'bold'), 10, 'black'),
+        "game": (('Arial', 12), 30, 'white'),
+        "round": (('Arial', 14, 'bold'), 10, 'black'),
+        "total": (('Arial', 12), 20, 'black'),
+        "score": (('Arial', 11), 30, 'black'),
+        "eliminated": (('Arial', 12), 20, 'red'),
+        "winner": (('Arial', 18, 'bold'), 10, 'green'),
+        "none": (('Arial', 18, 'bold'), 10, 'red'),
+    }
+    
+    def __init__(self, parent: Frame, view: ResultsView):
+        self.view = view
+        self.games = view.games
+        self.votes = view.votes
+        self.voter_names = view.voter_names
+        self.filter_generation = 0
+        if isinstance(self.votes, BallotStore):
+            self.ballot_lengths = self.votes.lengths()
+        else:
+            self.ballot_lengths = array('q', map(len, self.votes))
+        
+        search_frame = Frame(parent)
+        search_frame.pack(fill='x', padx=10, pady=(0, 5))
+        Label(search_frame, text="Search ballots:", font=('Arial', 12)).pack(side=LEFT)
+        self.search_entry = Entry(search_frame, font=('Arial', 12))
+        self.search_entry.pack(side=LEFT, fill='x', expand=True, padx=5)
+        self.search_entry.bind('<KeyRelease>', self.on_search_changed)
+        self.match_label = Label(search_frame, font=('Arial', 12))
+        self.match_label.pack(side=LEFT)
+        
+        container = Frame(parent)
+        container.pack(fill=BOTH, expand=True)
+        
+        self.scrollbar = Scrollbar(container)
+        self.scrollbar.pack(side=RIGHT, fill=Y)
+        
+        self.canvas = Canvas(container, yscrollcommand=self.on_scrolled)
+        self.canvas.pack(side=LEFT, fill=BOTH, expand=True)
+        self.scrollbar.config(command=self.canvas.yview)
+        
+        # Add mousewheel scrolling support
+        self.canvas.bind("<MouseWheel>", lambda e: self.canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
+        self.canvas.bind("<Configure>", lambda e: self.render())
+        
+        self.header_rows = [("title", "Voting Details (Boys Night Points Voting)", None)]
+        self.footer_rows = self._build_footer_rows()
+        self.apply_filter("")
+
+    def _build_footer_rows(self) -> List[Tuple[str, str, Optional[str]]]:
+        rows = [("title", "Round Results", None)]
+        for display in self.view.round_displays:
+            rows.append(("round", display.header, None))
+            rows.append(("total", f"Total Boys Night Points: {display.total_points:.1f}", None))
+            for game, score, percentage in display.scores:
+                rows.append(("score", f"{game}: {score:.1f} Boys Night points ({percentage:.1f}%)", None))
+            if display.eliminated:
+                rows.append(("eliminated", f"Eliminated: {display.eliminated}", None))
+        
+        if self.view.winner:
+            rows.append(("winner", f"WINNER: {self.view.winner}", None))
+        else:
+            rows.append(("none", "No winner determined", None))
+        return rows
+
+    def voter_name(self, ballot_index: int) -> str:
+        if ballot_index < len(self.voter_names) and self.voter_names[ballot_index] is not None:
+            return self.voter_names[ballot_index]
+        return f"Ballot {ballot_index + 1}"
+
+    def on_search_changed(self, event: Any = None) -> None:
+        self.filter_generation += 1
+        generation = self.filter_generation
+        query = self.search_entry.get()
+        
+        def run_filter() -> None:
+            if generation == self.filter_generation:  # no newer keystroke since
+                self.apply_filter(query)
+        
+        self.view.schedule(self.FILTER_DELAY_MS, run_filter)
+
+    def apply_filter(self, query: str) -> None:
+        """Keep ballots whose voter or any ranked game contains the query (case-insensitive)"""
+        query = query.strip().lower()
+        num_ballots = len(self.votes)
+        if query:
+            matching_games = {i for i, game in enumerate(self.games) if query in game.lower()}
+            shown = array('q', (i for i, vote in enumerate(self.votes)
+                                if not matching_games.isdisjoint(vote) 
+                                or query in self.voter_name(i).lower()))
+        else:
+            shown = array('q', range(num_ballots))
+        
+        # First row of each shown ballot within the ballot section (title row + one per
+        # game), followed by the section's total row count
+        lengths = self.ballot_lengths
+        starts = array('q', itertools.accumulate((lengths[i] + 1 for i in shown), initial=0))
+        
+        self.shown_ballots = shown
+        self.ballot_row_starts = starts
+        self.ballot_rows = starts[-1]
+        self.total_rows = len(self.header_rows) + self.ballot_rows + len(self.footer_rows)
+        self.match_label.config(text=f"{len(shown)} of {num_ballots} ballots")
+        
+        self.canvas.config(scrollregion=(0, 0, 0, self.total_rows * self.ROW_HEIGHT))
+        self.canvas.yview_moveto(0)
+        self.render()
+
+    def row(self, index: int) -> Tuple[str, str, Optional[str]]:
+        """(kind, text, background color) of a list row"""
+        if index < len(self.header_rows):
+            return self.header_rows[index]
+        index -= len(self.header_rows)
+        if index >= self.ballot_rows:
+            return self.footer_rows[index - self.ballot_rows]
+        
+        k = bisect.bisect_right(self.ballot_row_starts, index) - 1
+        ballot_index = self.shown_ballots[k]
+        offset = index - self.ballot_row_starts[k]
+        if offset == 0:
+            return ("voter", f"{self.voter_name(ballot_index)}'s Vote:", None)
+        game_name = self.games[self.votes[ballot_index][offset - 1]]
+        return ("game", f"{offset}. {game_name}", self.view.controller.get_game_color(game_name))
+
+    def on_scrolled(self, first: str, last: str) -> None:
+        self.scrollbar.set(first, last)
+        self.render()
+
+    def render(self) -> None:
+        """Redraw just the rows intersecting the visible part of the canvas"""
+        self.canvas.delete("rows")
+        top = self.canvas.canvasy(0)
+        width = self.canvas.winfo_width()
+        first = max(0, int(top // self.ROW_HEIGHT))
+        last = min(self.total_rows, int((top + self.canvas.winfo_height()) // self.ROW_HEIGHT) + 1)
+        
+        for index in range(first, last):
+            kind, text, background = self.row(index)
+            font, indent, fill = self.ROW_STYLES[kind]
+            y_pos = index * self.ROW_HEIGHT
+            if background:
+                self.canvas.create_rectangle(indent - 10, y_pos + 2, width - 10, y_pos + self.ROW_HEIGHT - 2,
+                                             fill=background, outline='', tags=("rows",))
+            self.canvas.create_text(indent, y_pos + self.ROW_HEIGHT // 2, text=text, font=font,
+                                    fill=fill, anchor='w', tags=("rows",))
+
+
 class ResultsView(BaseView):
     def __init__(self, root: Tk, controller: Any):
         super().__init__(root, controller)
+        self.animations = AnimationScheduler(root)
+        self.sprites = SpriteCache()
+        self.pending_after_ids: Set[str] = set()  # every root.after id queued by this view
+        self.round_displays: List[RoundDisplay] = []
+        self.round_items: Dict[str, int] = {}  # reusable canvas items of the round screen
+        self.detailed_list: Optional[DetailedResultsList] = None
+        self.canvas_size: Tuple[int, int] = (0, 0)  # size the canvas contents were laid out for
+        self.layout_scale: float = 1.0  # canvas size relative to 1920x1080, clamped to the sprite buckets
+        self.canvas_fonts: Dict[Tuple[Any, ...], Any] = {}  # named fonts of canvas text, by base size and style
+        self.screen: str = ""  # "round", "final" or "detailed"; what on_resize re-lays out
+        self.showing_winner: bool = False
+        # In-flight tweens: item -> ([start_x, start_y, target_x, target_y, progress], relayout)
+        self.flights: Dict[int, Tuple[List[float], Optional[Callable[[], Tuple[float, ...]]]]] = {}
         self.nav_frame: Optional[Frame] = None
         self.current_round_index: int = 0
         self.round_results: Dict[str, Any] = {}
         self.games: List[str] = []
         self.votes: List[List[int]] = []
-        self.voter_names: List[str] = []
-        self.filename: str = ""
+        self.voter_names: List[Optional[str]] = []
+        self.filename: Optional[str] = None  # None while the background save is running
+        self.save_error: Optional[str] = None
         self.winner: Optional[str] = None
         self.trashcan_image: Optional[ImageTk.PhotoImage] = None
         self.results_canvas: Optional[Canvas] = None
@@ -805,8 +2156,8 @@ class ResultsView(BaseView):
         self.button_text_color: str = 'SystemWindowText'
         
     def create_widgets(self, winner: Optional[str], round_results: Dict[str, Any], 
-                      filename: str, games: List[str], votes: List[List[int]], 
-                      voter_names: List[str]) -> None:
+                      filename: Optional[str], games: List[str], votes: List[List[int]], 
+                      voter_names: List[Optional[str]], save_error: Optional[str] = None) -> None:
         """Initialize the results view with voting data"""
         # Clear existing widgets
         for widget in self.frame.winfo_children():
@@ -816,12 +2167,14 @@ class ResultsView(BaseView):
         self.winner = winner
         self.round_results = round_results
         self.filename = filename
+        self.save_error = save_error
         self.games = games
         self.votes = votes
         self.voter_names = voter_names
         
         # Reset state
         self.current_round_index = 0
+        self.round_displays = self._build_round_displays()
         
         # Create header
         self._create_header()
@@ -843,6 +2196,39 @@ class ResultsView(BaseView):
         # The podium will be shown after all elimination rounds are completed
         self.animate_elimination_round()
 
+    def hide(self) -> None:
+        self.cancel_scheduled()
+        super().hide()
+
+    def schedule(self, delay_ms: int, callback: Callable[[], None]) -> str:
+        """root.after that is tracked so navigation can cancel it"""
+        def run() -> None:
+            self.pending_after_ids.discard(after_id)
+            self._report_pending_callbacks()
+            callback()
+        
+        after_id = self.controller.root.after(delay_ms, run)
+        self.pending_after_ids.add(after_id)
+        self._report_pending_callbacks()
+        return after_id
+
+    def cancel_scheduled(self) -> None:
+        """Cancel every queued timer and tween, e.g. before showing another round"""
+        for after_id in self.pending_after_ids:
+            self.controller.root.after_cancel(after_id)
+        self.pending_after_ids.clear()
+        self.animations.cancel_all()
+        self.flights.clear()
+        self._report_pending_callbacks()
+
+    @property
+    def pending_callbacks(self) -> int:
+        return len(self.pending_after_ids) + (self.animations.after_id is not None)
+
+    def _report_pending_callbacks(self) -> None:
+        if self.controller.debug_timers:
+            print(f"ResultsView pending callbacks: {self.pending_callbacks}")
+
     def _create_header(self) -> None:
         """Create the results header"""
         header = Label(
@@ -904,16 +2290,15 @@ class ResultsView(BaseView):
         
         # Create canvas with proper configuration
         self.results_canvas = Canvas(canvas_container, bg='lightgray')
+        self.round_items = {}
         self.results_canvas.pack(fill=BOTH, expand=True)
         
         # Add mousewheel scrolling support
         self.results_canvas.bind("<MouseWheel>", self.on_mousewheel)
-        
-        self.create_trashcan_image()
 
-    def create_trashcan_image(self) -> None:
-        """Create a trashcan image for animations"""
-        trashcan_size = 400  # Doubled again to make it much larger
+    @staticmethod
+    def render_trashcan(trashcan_size: int) -> Image.Image:
+        """Rasterize the trashcan artwork (400 px at full HD) for the sprite cache"""
         img = Image.new('RGB', (trashcan_size, trashcan_size), 'lightgray')
         draw = ImageDraw.Draw(img)
         
@@ -950,7 +2335,16 @@ class ResultsView(BaseView):
         for i in range(int(bar_start_x), int(bar_end_x), int(bar_spacing * 2)):
             draw.line([i, bar_top, i, bar_bottom], fill='black', width=4)
         
-        self.trashcan_image = ImageTk.PhotoImage(img)
+        return img
+
+    @staticmethod
+    def render_podium_block(width: int, height: int, color: str) -> Image.Image:
+        img = Image.new('RGB', (width, height), color)
+        ImageDraw.Draw(img).rectangle([0, 0, width - 1, height - 1], outline='black', width=2)
+        return img
+
+    def _trashcan_size(self, canvas_width: int, canvas_height: int) -> int:
+        return int(400 * SpriteCache.bucket(canvas_width, canvas_height))
 
     def on_mousewheel(self, event: Any) -> None:
         """Handle mousewheel scrolling on the canvas"""
@@ -970,83 +2364,106 @@ class ResultsView(BaseView):
                 self.show_winner_animation()
             return
             
-        round_data = rounds[self.current_round_index]
+        display = self.round_displays[self.current_round_index]
         
-        # Clear canvas
-        self.results_canvas.delete("all")
+        # Drop tweens and flying games from the previous round, then hide (not delete)
+        # the reusable round items; whatever this round needs is shown again below
+        self.cancel_scheduled()
+        self.results_canvas.delete("transient", "winner")
+        self.screen = "round"
+        self.showing_winner = False
+        self._layout_round(display)
+        
+        # Create navigation controls
+        self._create_navigation_controls()
+        
+        # Update round counter
+        total_rounds = len(rounds)
+        # Add 1 for the final results screen if we have podium data
+        if self._has_podium_data():
+            total_rounds += 1
+            
+            
+        self.round_counter.config(text=f"Round {self.current_round_index + 1} of {total_rounds}")
+        
+        # Animate eliminated games if any (unless it's the final round)
+        eliminated_game = display.eliminated
+        if eliminated_game and not display.is_final:
+            self.schedule(1000, lambda: self.animate_games_sequentially([eliminated_game]))
+
+    def _layout_round(self, display: RoundDisplay) -> None:
+        """Place a round's items for the current canvas size (also re-run on resize)"""
+        self.results_canvas.itemconfigure("round", state="hidden")
         
         # Get current canvas dimensions
         canvas_width, canvas_height = self._get_canvas_dimensions()
         center_x = canvas_width // 2
         
         # Display round header
-        self.results_canvas.create_text(
-            center_x, 30,
-            text=f"Round {round_data['round']}",
-            font=("Arial", 24, "bold"),
+        self._show_round_item(
+            "header", "text", (center_x, self._px(30)),
+            text=display.header,
+            font=self.canvas_font(24, "bold"),
             fill="black"
         )
         
-        # Check if this is the final elimination round (before winner reveal)
-        is_final_round = (self.current_round_index == len(rounds) - 1)
-        
-        if is_final_round:
+        y_pos = self._px(70)
+        if display.is_final:
             # Display suspense message instead of scores
-            self.results_canvas.create_text(
-                center_x, canvas_height // 2,
+            self._show_round_item(
+                "suspense", "text", (center_x, canvas_height // 2),
                 text="And the winner is..!",
-                font=("Arial", 76, "bold"),
+                font=self.canvas_font(76, "bold"),
                 fill="black"
             )
             
           # Add some decorative elements to build anticipation
-            self.results_canvas.create_text(
-                center_x, canvas_height // 2 + 95,
+            self._show_round_item(
+                "suspense_note", "text", (center_x, canvas_height // 2 + self._px(95)),
                 text=f"You punks had better've voted for Jaxson's nominee!",
-                font=("Arial", 25, "italic"),
+                font=self.canvas_font(25, "italic"),
                 fill="gray"
             )
         else:
             # Display scores with percentages and bar charts for non-final rounds
-            y_pos = 70
-            total_points = sum(round_data['game_totals'].values())
-            sorted_games = sorted(round_data['game_totals'].items(), key=lambda x: x[1], reverse=True)
-            max_score = max(round_data['game_totals'].values()) if round_data['game_totals'] else 1
-
-            for game, score in sorted_games:
-                self._draw_score_bar(game, score, total_points, max_score, center_x, y_pos, canvas_width)
-                y_pos += 30
+            bar_width = min(self._px(400), canvas_width * 0.6)  # Responsive bar width
+            bar_x = center_x - bar_width // 2  # Position bars in the center
+            for row_index, row in enumerate(display.rows):
+                self._draw_score_bar(row_index, row, bar_x, bar_width, y_pos)
+                y_pos += self._px(30)
         
         # Display elimination explanation (unless it's the final round)
-        eliminated_game = round_data.get('eliminated')
-        if eliminated_game and not is_final_round:
-            y_pos = self._draw_elimination_explanation(round_data, eliminated_game, center_x, y_pos, canvas_width)
+        if display.eliminated and not display.is_final:
+            y_pos = self._draw_elimination_explanation(display, center_x, y_pos, canvas_width)
         
         # Display total points and eliminated points (unless it's the final round)
-        if not is_final_round:
-            y_pos = self._draw_points_info(round_data, center_x, y_pos)
+        if not display.is_final:
+            y_pos = self._draw_points_info(display, center_x, y_pos)
         
         # Position trashcan at bottom right
         self._draw_trashcan(canvas_width, canvas_height)
-        
-        # Create navigation controls
-        self._create_navigation_controls()
-        
-        # Update round counter
-        total_rounds = len(rounds)
-        # Add 1 for the final results screen if we have podium data
-        if self._has_podium_data():
-            total_rounds += 1
-            
-        self.round_counter.config(text=f"Round {self.current_round_index + 1} of {total_rounds}")
-        
-        # Animate eliminated games if any (unless it's the final round)
-        if eliminated_game and not is_final_round:
-            trashcan_x = canvas_width - 300
-            trashcan_y = canvas_height - 300
-            self.controller.root.after(1000, lambda: self.animate_games_sequentially(
-                [eliminated_game], trashcan_x, trashcan_y
-            ))
+
+    def _build_round_displays(self) -> List[RoundDisplay]:
+        """Precompute the display model of every round once per set of results"""
+        rounds = self.round_results.get('rounds', [])
+        return [RoundDisplay(round_data, i == len(rounds) - 1, self.controller.get_game_color)
+                for i, round_data in enumerate(rounds)]
+
+    def _show_round_item(self, key: str, kind: str, coords: Tuple[float, ...], **options: Any) -> int:
+        """Create a round item on first use; afterwards only move, reconfigure and unhide it"""
+        item = self.round_items.get(key)
+        if item is None:
+            create = getattr(self.results_canvas, f"create_{kind}")
+            item = self.round_items[key] = create(*coords, tags=("round",), **options)
+        else:
+            self.results_canvas.coords(item, *coords)
+            self.results_canvas.itemconfigure(item, state="normal", **options)
+        return item
+
+    def _clear_canvas(self) -> None:
+        """Delete every canvas item, including the reusable round items"""
+        self.results_canvas.delete("all")
+        self.round_items = {}
 
     def _get_canvas_dimensions(self) -> Tuple[int, int]:
         """Get the current canvas dimensions with fallback defaults"""
@@ -1059,75 +2476,101 @@ class ResultsView(BaseView):
         if canvas_height <= 1:
             canvas_height = 1080
             
+        self.canvas_size = (canvas_width, canvas_height)
+        self._set_layout_scale(canvas_width, canvas_height)
         return canvas_width, canvas_height
 
-    def _draw_score_bar(self, game: str, score: float, total_points: float, 
-                       max_score: float, center_x: int, y_pos: int, 
-                       canvas_width: int) -> None:
+    def _set_layout_scale(self, canvas_width: int, canvas_height: int) -> None:
+        scale = min(canvas_width / 1920, canvas_height / 1080)
+        self.layout_scale = max(SpriteCache.BUCKETS[0], min(SpriteCache.BUCKETS[-1], scale))
+        for (base_size, *_), font in self.canvas_fonts.items():
+            size = self._font_size(base_size)
+            if font.cget('size') != size:
+                font.configure(size=size)  # every canvas item using this font follows
+
+    def _px(self, value: float) -> int:
+        """A full-HD layout distance at the current canvas scale"""
+        return int(value * self.layout_scale)
+
+    def _font_size(self, base_size: int) -> int:
+        return max(6, round(base_size * self.layout_scale))
+
+    def canvas_font(self, base_size: int, *styles: str) -> Any:
+        """Named Arial font for canvas text, sized for a full-HD canvas and scaled with it"""
+        key = (base_size,) + styles
+        font = self.canvas_fonts.get(key)
+        if font is None:
+            font = self.canvas_fonts[key] = tkfont.Font(
+                root=self.root, family='Arial', size=self._font_size(base_size),
+                weight='bold' if 'bold' in styles else 'normal',
+                slant='italic' if 'italic' in styles else 'roman')
+        return font
+
+    def on_resize(self) -> None:
+        """Re-lay out the visible screen for the new canvas size, steering any game in flight"""
+        if not self.results_canvas or not self.results_canvas.winfo_exists():
+            return
+        old_size = self.canvas_size
+        if self._get_canvas_dimensions() == old_size:
+            return
+        if self.screen == "round" and self.current_round_index < len(self.round_displays):
+            self._layout_round(self.round_displays[self.current_round_index])
+            if self.showing_winner:
+                self.show_winner_animation()
+            self._retarget_flights()
+        elif self.screen == "final":
+            self._draw_final_canvas()
+
+    def _draw_score_bar(self, row_index: int, row: Tuple[str, str, float, str], 
+                       bar_x: float, bar_width: float, y_pos: int) -> None:
         """Draw a score bar for a game"""
-        percentage = (score / total_points * 100) if total_points > 0 else 0
+        game, color, fill_fraction, label = row
         
-        # Get color for this game
-        if game in self.games:
-            color_index = self.games.index(game) % len(self.controller.get_color_palette())
-            color = self.controller.get_color_palette()[color_index]
-        else:
-            color = "gray"
-        
-        # Create bar chart visualization
-        bar_width = min(400, canvas_width * 0.6)  # Responsive bar width
-        bar_fill = (score / max_score) * bar_width if max_score > 0 else 0
-        
-        # Position bars in the center
-        bar_x = center_x - bar_width // 2
+        half_height = self._px(10)
         
         # Draw bar background
-        self.results_canvas.create_rectangle(
-            bar_x, y_pos - 10,
-            bar_x + bar_width, y_pos + 10,
+        self._show_round_item(
+            f"bar_bg{row_index}", "rectangle",
+            (bar_x, y_pos - half_height, bar_x + bar_width, y_pos + half_height),
             fill='#EEEEEE', outline=''
         )
         
         # Draw filled portion of bar
-        self.results_canvas.create_rectangle(
-            bar_x, y_pos - 10,
-            bar_x + bar_fill, y_pos + 10,
+        self._show_round_item(
+            f"bar_fill{row_index}", "rectangle",
+            (bar_x, y_pos - half_height, bar_x + fill_fraction * bar_width, y_pos + half_height),
             fill=color, outline=''
         )
         
         # Add score text
-        self.results_canvas.create_text(
-            bar_x + bar_width + 10, y_pos,
-            text=f"{game}: {score:.1f} points ({percentage:.1f}%)",
-            font=("Arial", 12),
+        self._show_round_item(
+            f"bar_text{row_index}", "text", (bar_x + bar_width + self._px(10), y_pos),
+            text=label,
+            font=self.canvas_font(12),
             fill=color,
             anchor="w"
         )
 
-    def _draw_elimination_explanation(self, round_data: Dict[str, Any], 
-                                    eliminated_game: str, center_x: int, 
+    def _draw_elimination_explanation(self, display: RoundDisplay, center_x: int, 
                                     y_pos: int, canvas_width: int) -> int:
         """Draw the elimination explanation and return the new y position"""
-        min_score = min(round_data['game_totals'].values()) if round_data['game_totals'] else 0
-        
-        explanation = f"{eliminated_game} was eliminated for having the lowest score ({min_score:.1f} points)"
-        
-        # Wrap text if it's too long
-        max_width = canvas_width - 40
-        lines = self._wrap_text(explanation, max_width, 10)  # 10 pixels per character estimate
+        # Wrap for the full-HD font size; the scaled font shrinks or grows with the width
+        lines = display.explanation_lines(int((canvas_width - 40) / self.layout_scale))
+        line_height = self._px(20)
         
         for i, line in enumerate(lines):
-            self.results_canvas.create_text(
-                center_x, y_pos + 20 + i * 20,
+            self._show_round_item(
+                f"explanation{i}", "text", (center_x, y_pos + line_height + i * line_height),
                 text=line,
-                font=("Arial", 12, "bold"),
+                font=self.canvas_font(12, "bold"),
                 fill="red",
                 anchor="center"
             )
         
-        return y_pos + 20 * len(lines) + 20
+        return y_pos + line_height * len(lines) + line_height
 
-    def _wrap_text(self, text: str, max_width: int, char_width: int) -> List[str]:
+    @staticmethod
+    def _wrap_text(text: str, max_width: int, char_width: int) -> List[str]:
         """Wrap text to fit within a specified width"""
         words = text.split()
         lines = []
@@ -1148,39 +2591,45 @@ class ResultsView(BaseView):
             
         return lines
 
-    def _draw_points_info(self, round_data: Dict[str, Any], center_x: int, y_pos: int) -> int:
+    def _draw_points_info(self, display: RoundDisplay, center_x: int, y_pos: int) -> int:
         """Draw points information and return the new y position"""
-        total_points = sum(round_data['game_totals'].values()) if round_data['game_totals'] else 0
-        
-        self.results_canvas.create_text(
-            center_x, y_pos + 20,
-            text=f"Total Points: {total_points:.1f}",
-            font=("Arial", 50, "bold"),
+        self._show_round_item(
+            "points_info", "text", (center_x, y_pos + self._px(20)),
+            text=display.total_text,
+            font=self.canvas_font(50, "bold"),
             fill="black",
             anchor="center"
         )
-        y_pos += 30
+        y_pos += self._px(30)
         
         return y_pos
 
     def _draw_trashcan(self, canvas_width: int, canvas_height: int) -> None:
         """Draw the trashcan image on the canvas"""
-        # Get the actual size of the trashcan image
-        trashcan_width = 400  # Should match the size you set in create_trashcan_image
-        trashcan_height = 400
+        # Pick the pre-rendered sprite for this canvas size
+        trashcan_size = self._trashcan_size(canvas_width, canvas_height)
+        self.trashcan_image = self.sprites.get(("trashcan", trashcan_size), 
+                                               lambda: self.render_trashcan(trashcan_size))
         
         # Position with proper margin from edges
-        margin = 50  # Desired margin from canvas edges
-        trashcan_x = canvas_width - margin - (trashcan_width // 2)
-        trashcan_y = canvas_height - margin - (trashcan_height // 2)
+        margin = self._px(50)  # Desired margin from canvas edges
+        trashcan_x = canvas_width - margin - (trashcan_size // 2)
+        trashcan_y = canvas_height - margin - (trashcan_size // 2)
         
         if self.trashcan_image:
-            self.results_canvas.create_image(
-                trashcan_x, trashcan_y,
+            self._show_round_item(
+                "trashcan", "image", (trashcan_x, trashcan_y),
                 image=self.trashcan_image,
                 anchor="center"
             )
 
+    def _trashcan_target(self) -> Tuple[int, int]:
+        """Where eliminated games fly to: a little up and left of the trashcan's center"""
+        canvas_width, canvas_height = self.canvas_size
+        trashcan_size = self._trashcan_size(canvas_width, canvas_height)
+        return (canvas_width - self._px(50) - trashcan_size // 2 - trashcan_size // 8,
+                canvas_height - self._px(50) - trashcan_size // 2 - trashcan_size // 8)
+
     def _create_navigation_controls(self) -> None:
         """Create navigation controls for round navigation"""
         # Remove previous navigation frame if it exists
@@ -1240,106 +2689,103 @@ class ResultsView(BaseView):
                 )
                 final_button.pack(side="left", padx=10)
 
-    def animate_games_sequentially(self, games: List[str], trashcan_x: int, trashcan_y: int) -> None:
+    def animate_games_sequentially(self, games: List[str]) -> None:
         """Animate games being eliminated sequentially"""
         if not games:
             rounds = self.round_results.get('rounds', [])
             if self.current_round_index < len(rounds) - 1:
-                self.controller.root.after(1000, self.next_round)
+                self.schedule(1000, self.next_round)
             else:
                 # After last elimination round, show final results if we have podium data
                 if self._has_podium_data():
-                    self.controller.root.after(1000, self.show_final_results)
+                    self.schedule(1000, self.show_final_results)
                 else:
-                    self.controller.root.after(1000, self.show_winner_animation)
+                    self.schedule(1000, self.show_winner_animation)
             return
                 
         game = games.pop(0)
         
         # Get color for this game
-        if game in self.games:
-            game_index = self.games.index(game)
-            color = self.controller.get_color_palette()[game_index % len(self.controller.get_color_palette())]
-        else:
-            color = "gray"
-        
-        # Get current canvas dimensions
-        canvas_width, canvas_height = self._get_canvas_dimensions()
+        color = self.controller.get_game_color(game)
         
-        # Find the position of this game in the results display
-        round_data = self.round_results['rounds'][self.current_round_index]
-        sorted_games = sorted(round_data['game_totals'].items(), key=lambda x: x[1], reverse=True)
+        # Start the game at its rank in the precomputed results rows
+        display = self.round_displays[self.current_round_index]
+        row = display.row_of.get(game)
         
-        # Calculate the position based on the game's ranking
-        start_y = 100  # Default starting position
-        for i, (game_name, score) in enumerate(sorted_games):
-            if game_name == game:
-                # Position the game at its rank in the results
-                start_y = 100 + i * 30  # 30 pixels between each game
-                break
-        
-        # Position game text at the left side of the canvas
-        start_x = 50
+        def flight_path() -> Tuple[int, int, int, int]:
+            # Position game text at the left side of the canvas, 30 pixels between each game
+            start_y = self._px(100) + row * self._px(30) if row is not None else self._px(100)
+            return (self._px(50), start_y) + self._trashcan_target()
         
+        start_x, start_y, trashcan_x, trashcan_y = flight_path()
         game_id = self.results_canvas.create_text(
             start_x, start_y,
             text=game,
-            font=('Arial', 75, 'bold'),
+            font=self.canvas_font(75, 'bold'),
             fill=color,
-            anchor='w'  # Anchor to the west (left) side
+            anchor='w',  # Anchor to the west (left) side
+            tags=("transient",)
         )
         
-        self.controller.root.after(500, lambda: self.animate_movement_with_callback(
-            game_id, trashcan_x, trashcan_y, 15,
-            lambda: self.on_game_reached_trashcan(game_id, games, trashcan_x, trashcan_y)
-        ))
+        self.animate_movement_with_callback(
+            game_id, trashcan_x, trashcan_y, ELIMINATION_TWEEN_SECONDS,
+            lambda: self.on_game_reached_trashcan(game_id, games),
+            delay=0.5, relayout=flight_path
+        )
         
     def animate_movement_with_callback(self, item_id: int, target_x: int, target_y: int, 
-                                     steps: int, callback: Callable) -> None:
-        """Animate movement of an item with a callback when complete"""
-        if not self.results_canvas or not self.results_canvas.winfo_exists():
-            return
-            
-        current_coords = self.results_canvas.coords(item_id)
+                                     duration: float, callback: Callable, delay: float = 0.0,
+                                     relayout: Optional[Callable[[], Tuple[float, ...]]] = None) -> None:
+        """Tween an item to the target on the shared scheduler, then delete it and call back.
+
+        ``relayout`` returns a fresh (start_x, start_y, target_x, target_y) after a resize.
+        """
+        canvas = self.results_canvas
+        current_coords = canvas.coords(item_id)
         if len(current_coords) < 2:
             callback()
             return
-            
-        current_x, current_y = current_coords[0], current_coords[1]
+        path = [current_coords[0], current_coords[1], target_x, target_y, 0.0]
+        self.flights[item_id] = (path, relayout)
         
-        if abs(current_x - target_x) < 5 and abs(current_y - target_y) < 5:
-            self.results_canvas.delete(item_id)
-            callback()
-            return
-            
-        new_x = current_x + (target_x - current_x) / (steps / .55)
-        new_y = current_y + (target_y - current_y) / (steps / .55)
+        def step(progress: float) -> None:
+            path[4] = progress
+            self._place_flight(item_id, path)
         
-        self.results_canvas.coords(item_id, new_x, new_y)
+        def done() -> None:
+            self.flights.pop(item_id, None)
+            canvas.delete(item_id)
+            callback()
         
-        if self.results_canvas.winfo_exists():
-            self.controller.root.after(10, lambda: self.animate_movement_with_callback(
-                item_id, target_x, target_y, steps, callback
-            ))
+        self.animations.tween(duration, step, done, delay=delay)
 
-    def on_game_reached_trashcan(self, game_id: int, remaining_games: List[str], 
-                               trashcan_x: int, trashcan_y: int) -> None:
+    def _place_flight(self, item_id: int, path: List[float]) -> None:
+        start_x, start_y, target_x, target_y, progress = path
+        self.results_canvas.coords(item_id, start_x + (target_x - start_x) * progress, 
+                                   start_y + (target_y - start_y) * progress)
+
+    def _retarget_flights(self) -> None:
+        """Point tweens in progress at the re-laid-out positions, keeping their progress"""
+        for item_id, (path, relayout) in self.flights.items():
+            if relayout is not None:
+                path[:4] = relayout()
+                self._place_flight(item_id, path)
+
+    def on_game_reached_trashcan(self, game_id: int, remaining_games: List[str]) -> None:
         """Handle when a game reaches the trashcan"""
         # Simply remove the game and proceed
         self.results_canvas.delete(game_id)
         
         if remaining_games:
-            self.controller.root.after(500, lambda: self.animate_games_sequentially(
-                remaining_games, trashcan_x, trashcan_y
-            ))
+            self.schedule(500, lambda: self.animate_games_sequentially(remaining_games))
         elif self.current_round_index < len(self.round_results.get('rounds', [])) - 1:
-            self.controller.root.after(1000, self.next_round)
+            self.schedule(1000, self.next_round)
         else:
             # After last elimination round, show final results if we have podium data
             if self._has_podium_data():
-                self.controller.root.after(1000, self.show_final_results)
+                self.schedule(1000, self.show_final_results)
             else:
-                self.controller.root.after(1000, self.show_winner_animation)
+                self.schedule(1000, self.show_winner_animation)
 
     def next_round(self) -> None:
         """Move to the next round"""
@@ -1362,12 +2808,13 @@ class ResultsView(BaseView):
 
     def show_final_results(self) -> None:
         """Show the final results with podium"""
+        self.cancel_scheduled()
+        
         # Check if canvas exists before trying to use it
-        if hasattr(self, 'results_canvas') and self.results_canvas.winfo_exists():
-            self.results_canvas.delete("all")
-        else:
+        if not self.results_canvas or not self.results_canvas.winfo_exists():
             # If canvas doesn't exist, recreate it
             self.setup_animation_view()
+        self.screen = "final"
         
         # Clear any existing navigation controls
         if self.nav_frame:
@@ -1379,21 +2826,7 @@ class ResultsView(BaseView):
         total_rounds = len(rounds) + 1  # Add 1 for the final results screen
         self.round_counter.config(text=f"Final Results ({total_rounds} of {total_rounds})")
         
-        # Show podium or winner animation
-        if self._has_podium_data():
-            self.show_podium()
-        else:
-            self.show_winner_animation()
-        
-        # Only add the filename text if the canvas exists
-        canvas_width, canvas_height = self._get_canvas_dimensions()
-        if hasattr(self, 'results_canvas') and self.results_canvas.winfo_exists():
-            self.results_canvas.create_text(
-                canvas_width // 2, canvas_height - 60,
-                text=f"Results saved to: {self.filename}",
-                font=('Arial', 12),
-                fill='gray'
-            )
+        self._draw_final_canvas()
         
         # Recreate buttons
         self.detailed_button = Button(
@@ -1412,6 +2845,42 @@ class ResultsView(BaseView):
         )
         self.restart_button.pack(pady=10)
 
+    def _draw_final_canvas(self) -> None:
+        """Draw the podium (or winner) and the save status for the current canvas size"""
+        self._clear_canvas()
+        
+        # Show podium or winner animation
+        if self._has_podium_data():
+            self.show_podium()
+        else:
+            self.show_winner_animation()
+        
+        canvas_width, canvas_height = self._get_canvas_dimensions()
+        text, color = self._save_status()
+        self.results_canvas.create_text(
+            canvas_width // 2, canvas_height - self._px(60),
+            text=text,
+            font=self.canvas_font(12),
+            fill=color,
+            tags=("save_status",)
+        )
+
+    def _save_status(self) -> Tuple[str, str]:
+        """Text and color of the results file line on the final screen"""
+        if self.save_error:
+            return f"Could not save results: {self.save_error}", 'red'
+        if self.filename is None:
+            return "Saving results...", 'gray'
+        return f"Results saved to: {self.filename}", 'gray'
+
+    def set_save_status(self, filename: Optional[str], error: Optional[Exception]) -> None:
+        """Called when a background save finishes; updates the final screen if it is up"""
+        self.filename = filename
+        self.save_error = str(error) if error else None
+        if self.results_canvas and self.results_canvas.winfo_exists():
+            text, color = self._save_status()
+            self.results_canvas.itemconfigure("save_status", text=text, fill=color)
+
     def back_to_animation(self) -> None:
         """Return to the animation view from detailed results"""
         # Clear the frame completely and recreate the results view
@@ -1420,95 +2889,21 @@ class ResultsView(BaseView):
         
         # Recreate the results view
         self.create_widgets(self.winner, self.round_results, self.filename, 
-                           self.games, self.votes, self.voter_names)
+                           self.games, self.votes, self.voter_names, self.save_error)
 
     def show_detailed_results(self) -> None:
         """Show detailed voting results"""
+        self.cancel_scheduled()
+        self.screen = "detailed"
+        
         # Clear the frame completely
         for widget in self.frame.winfo_children():
             widget.destroy()
         
-        # Create detailed results view
+        # Rows are drawn on demand, so imported elections of any size stay responsive
         container = Frame(self.frame)
         container.pack(fill=BOTH, expand=True)
-        
-        scrollbar = Scrollbar(container)
-        scrollbar.pack(side=RIGHT, fill=Y)
-        
-        canvas = Canvas(container, yscrollcommand=scrollbar.set)
-        canvas.pack(side=LEFT, fill=BOTH, expand=True)
-        scrollbar.config(command=canvas.yview)
-        
-        # Add mousewheel scrolling support
-        canvas.bind("<MouseWheel>", lambda e: canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-        
-        scroll_frame = Frame(canvas)
-        canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        
-        # Add voting details
-        Label(scroll_frame, text="Voting Details (Boys Night Points Voting)", 
-              font=('Arial', 24, 'bold')).pack(pady=20)
-        
-        for i, (voter, vote) in enumerate(zip(self.voter_names, self.votes)):
-            voter_frame = Frame(scroll_frame, relief=RAISED, bd=1)
-            voter_frame.pack(fill='x', padx=10, pady=5)
-            
-            Label(voter_frame, text=f"{voter}'s Vote:", 
-                  font=('Arial', 16, 'bold')).pack(anchor='w', padx=10, pady=5)
-            
-            for j, game_idx in enumerate(vote):
-                if game_idx < len(self.games):
-                    game_name = self.games[game_idx]
-                    color = self.controller.get_color_palette()[game_idx % len(self.controller.get_color_palette())]
-                    
-                    game_frame = Frame(voter_frame, bg=color)
-                    game_frame.pack(fill='x', padx=20, pady=2)
-                    
-                    Label(game_frame, text=f"{j+1}. {game_name}", font=('Arial', 14), 
-                          bg=color, fg='white').pack(anchor='w', padx=10, pady=5)
-        
-        # Add round results
-        Label(scroll_frame, text="Round Results", 
-              font=('Arial', 24, 'bold')).pack(pady=20)
-        
-        rounds = self.round_results.get('rounds', [])
-        for round_data in rounds:
-            round_frame = Frame(scroll_frame, relief=RAISED, bd=1)
-            round_frame.pack(fill='x', padx=10, pady=5)
-            
-            Label(round_frame, text=f"Round {round_data.get('round', 'N/A')}", 
-                  font=('Arial', 16, 'bold')).pack(anchor='w', padx=10, pady=5)
-            
-            total_points = sum(round_data['game_totals'].values()) if 'game_totals' in round_data else 0
-            Label(round_frame, text=f"Total Boys Night Points: {total_points:.1f}", 
-                  font=('Arial', 14)).pack(anchor='w', padx=20, pady=2)
-            
-            if 'game_totals' in round_data:
-                sorted_games = sorted(round_data['game_totals'].items(), key=lambda x: x[1], reverse=True)
-                for game, score in sorted_games:
-                    percentage = (score / total_points) * 100 if total_points > 0 else 0
-                    Label(round_frame, 
-                          text=f"{game}: {score:.1f} Boys Night points ({percentage:.1f}%)", 
-                          font=('Arial', 12)).pack(anchor='w', padx=30, pady=1)
-            
-            eliminated = round_data.get('eliminated')
-            if eliminated:
-                Label(round_frame, text=f"Eliminated: {eliminated}", 
-                      font=('Arial', 14), fg='red').pack(anchor='w', padx=20, pady=5)
-        
-        # Add final result
-        final_frame = Frame(scroll_frame, relief=RAISED, bd=1)
-        final_frame.pack(fill='x', padx=10, pady=10)
-        
-        if self.winner:
-            Label(final_frame, text=f"WINNER: {self.winner}", 
-                  font=('Arial', 20, 'bold'), fg='green').pack(pady=10)
-        else:
-            Label(final_frame, text="No winner determined", 
-                  font=('Arial', 20, 'bold'), fg='red').pack(pady=10)
-        
-        scroll_frame.update_idletasks()
-        canvas.config(scrollregion=canvas.bbox("all"))
+        self.detailed_list = DetailedResultsList(container, self)
         
         # Add back button
         back_button = Button(
@@ -1522,23 +2917,27 @@ class ResultsView(BaseView):
     def show_winner_animation(self) -> None:
         """Show winner animation"""
         canvas_width, canvas_height = self._get_canvas_dimensions()
+        center_y = canvas_height // 2
+        self.showing_winner = True
+        self.results_canvas.delete("winner")  # drawn again on resize
         
         if self.winner and self.winner in self.games:
-            winner_index = self.games.index(self.winner)
-            color = self.controller.get_color_palette()[winner_index % len(self.controller.get_color_palette())]
+            color = self.controller.get_game_color(self.winner)
             
             self.results_canvas.create_text(
-                canvas_width // 2, canvas_height // 2 - 50,
+                canvas_width // 2, center_y - self._px(50),
                 text="THE WINNER IS",
-                font=('Arial', 28, 'bold'),
-                fill='black'
+                font=self.canvas_font(28, 'bold'),
+                fill='black',
+                tags=("winner",)
             )
             
             self.results_canvas.create_text(
-                canvas_width // 2, canvas_height // 2,
+                canvas_width // 2, center_y,
                 text=self.winner,
-                font=('Arial', 150, 'bold'),
-                fill=color
+                font=self.canvas_font(150, 'bold'),
+                fill=color,
+                tags=("winner",)
             )
             
             # Show winner's points
@@ -1550,22 +2949,24 @@ class ResultsView(BaseView):
                     total_points = sum(final_round['game_totals'].values())
                     percentage = (score / total_points) * 100 if total_points > 0 else 0
                     self.results_canvas.create_text(
-                        canvas_width // 2, canvas_height // 2 + 50,
+                        canvas_width // 2, center_y + self._px(50),
                         text=f"with {score:.1f} Boys Night points ({percentage:.1f}%)",
-                        font=('Arial', 20),
-                        fill='black'
+                        font=self.canvas_font(20),
+                        fill='black',
+                        tags=("winner",)
                     )
         else:
             self.results_canvas.create_text(
-                canvas_width // 2, canvas_height // 2,
+                canvas_width // 2, center_y,
                 text="No winner could be determined",
-                font=('Arial', 28, 'bold'),
-                fill='red'
+                font=self.canvas_font(28, 'bold'),
+                fill='red',
+                tags=("winner",)
             )
 
     def show_podium(self) -> None:
         """Show podium with top 3 winners"""
-        self.results_canvas.delete("all")
+        self._clear_canvas()
         
         # Get podium data from the correct location
         if 'podium' in self.round_results:
@@ -1579,76 +2980,38 @@ class ResultsView(BaseView):
             return
             
         canvas_width, canvas_height = self._get_canvas_dimensions()
-        base_y = canvas_height - 100
-        
-        # First place
-        first_x = canvas_width // 2
-        first_height = 650
-        self.results_canvas.create_rectangle(
-            first_x - 80, base_y - first_height,
-            first_x + 80, base_y,
-            fill="gold", outline="black", width=2
-        )
-        self.results_canvas.create_text(
-            first_x, base_y - first_height - 30,
-            text=f"1st: {podium[0]['game']}",
-            font=("Arial", 25, "bold"),
-            fill="black"
-        )
-        self.results_canvas.create_text(
-            first_x, base_y - first_height + 20,
-            text=f"{podium[0]['score']:.1f} Boys Night points",
-            font=("Arial", 25),
-            fill="black"
-        )
-        
-        # Second place
-        second_x = canvas_width // 3
-        second_height = 325
-        self.results_canvas.create_rectangle(
-            second_x - 80, base_y - second_height,
-            second_x + 80, base_y,
-            fill="silver", outline="black", width=2
-        )
-        self.results_canvas.create_text(
-            second_x, base_y - second_height - 30,
-            text=f"2nd: {podium[1]['game']}",
-            font=("Arial", 25, "bold"),
-            fill="black"
-        )
-        self.results_canvas.create_text(
-            second_x, base_y - second_height + 20,
-            text=f"{podium[1]['score']:.1f} Boys Night points",
-            font=("Arial", 25),
-            fill="black"
-        )
-        
-        # Third place
-        third_x = 2 * canvas_width // 3
-        third_height = 163
-        self.results_canvas.create_rectangle(
-            third_x - 80, base_y - third_height,
-            third_x + 80, base_y,
-            fill="#CD7F32", outline="black", width=2
-        )
-        self.results_canvas.create_text(
-            third_x, base_y - third_height - 30,
-            text=f"3rd: {podium[2]['game']}",
-            font=("Arial", 25, "bold"),
-            fill="black"
-        )
-        self.results_canvas.create_text(
-            third_x, base_y - third_height + 20,
-            text=f"{podium[2]['score']:.1f} Boys Night points",
-            font=("Arial", 25),
-            fill="black"
-        )
+        base_y = canvas_height - self._px(100)
+        scale = SpriteCache.bucket(canvas_width, canvas_height)
+        block_width = int(160 * scale)
+        
+        places = [
+            ("1st", canvas_width // 2, 650, "gold"),
+            ("2nd", canvas_width // 3, 325, "silver"),
+            ("3rd", 2 * canvas_width // 3, 163, "#CD7F32"),
+        ]
+        for entry, (label, x_pos, height, color) in zip(podium, places):
+            height = int(height * scale)
+            block = self.sprites.get(("podium", color, block_width, height),
+                                     lambda: self.render_podium_block(block_width, height, color))
+            self.results_canvas.create_image(x_pos, base_y, image=block, anchor="s")
+            self.results_canvas.create_text(
+                x_pos, base_y - height - self._px(30),
+                text=f"{label}: {entry['game']}",
+                font=self.canvas_font(25, "bold"),
+                fill="black"
+            )
+            self.results_canvas.create_text(
+                x_pos, base_y - height + self._px(20),
+                text=f"{entry['score']:.1f} Boys Night points",
+                font=self.canvas_font(25),
+                fill="black"
+            )
         
         # Winner text
         self.results_canvas.create_text(
-            canvas_width // 2, 50,
+            canvas_width // 2, self._px(50),
             text=f"WINNER: {podium[0]['game']}",
-            font=("Arial", 100, "bold"),
+            font=self.canvas_font(100, "bold"),
             fill="gold"
         )
 
@@ -1659,8 +3022,23 @@ class GameVotingController:
         self.root = root
         self.model = JaxVotingSystem()
         self.view: Optional[BaseView] = None
+        self.views: Dict[type, BaseView] = {}
         self.current_phase = "suggestion"
         
+        # Icons render on worker threads; only PhotoImage conversion runs on the Tk loop
+        self.icon_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="icon-render")
+        self.icon_queue: queue.Queue = queue.Queue()
+        self.icon_jobs: Dict[str, Future] = {}
+        self.icon_poll_scheduled = False
+        # A single writer keeps saves ordered, so a repeat save sees the first one's hash
+        self.results_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="results-writer")
+        
+        # Called after each drag with the per-frame (latency ms, events coalesced) samples
+        self.drag_latency_hook: Optional[Callable[[List[Tuple[float, int]]], None]] = None
+        self.debug_timers = False  # print the results view's pending callback count
+        self.resize_after_id: Optional[str] = None
+        self.scaled_fonts: Dict[int, Any] = {}
+        
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
         self.width = int(screen_width * 0.8)
@@ -1681,35 +3059,66 @@ class GameVotingController:
         self.root.attributes('-fullscreen', not current_state)
     
     def on_window_resize(self, event: Any) -> None:
+        # A drag-resize sends one event per pixel; only remember the size and
+        # relayout once the events have stopped for RESIZE_SETTLE_MS
         if event.widget == self.root:
             self.width = event.width
             self.height = event.height
             
-            if self.view and hasattr(self.view, 'on_resize'):
-                self.view.on_resize()
+            if self.resize_after_id is not None:
+                self.root.after_cancel(self.resize_after_id)
+            self.resize_after_id = self.root.after(RESIZE_SETTLE_MS, self.apply_resize)
+    
+    def apply_resize(self) -> None:
+        self.resize_after_id = None
+        for base_size, font in self.scaled_fonts.items():
+            size = self.get_scaled_font_size(base_size)
+            if font.cget('size') != size:
+                font.configure(size=size)  # Tk re-lays out every widget using this font
+        
+        if self.view and hasattr(self.view, 'on_resize'):
+            self.view.on_resize()
     
     def get_scaled_font_size(self, base_size: int) -> int:
         return max(base_size, self.height // 40)
     
+    def get_scaled_font(self, base_size: int) -> Any:
+        """Shared named font that follows the window height as it is resized"""
+        font = self.scaled_fonts.get(base_size)
+        if font is None:
+            font = self.scaled_fonts[base_size] = tkfont.Font(
+                root=self.root, family='Arial', size=self.get_scaled_font_size(base_size))
+        return font
+    
     def get_game_image(self, game_name: str) -> Optional[ImageTk.PhotoImage]:
         return self.model.game_images.get(game_name)
     
     def get_color_palette(self) -> List[str]:
         return self.model.color_palette
     
+    def get_game_color(self, game_name: str) -> str:
+        return self.model.game_color(game_name)
+    
+    def _get_view(self, view_class: type) -> BaseView:
+        """Return the view of this type, building it the first time it is needed"""
+        view = self.views.get(view_class)
+        if view is None:
+            view = self.views[view_class] = view_class(self.root, self)
+        return view
+    
     def show_suggestion_phase(self) -> None:
         self.current_phase = "suggestion"
         if self.view:
             self.view.hide()
         
-        self.view = SuggestionView(self.root, self)
+        self.view = self._get_view(SuggestionView)
         self.view.show()
         if isinstance(self.view, SuggestionView):
             self.view.update_game_list(self.model.games)
     
     def add_game(self, game_name: str) -> None:
         if self.model.add_game(game_name):
-            self.model.create_game_icon(game_name)
+            self.queue_icon_render(game_name)
             if isinstance(self.view, SuggestionView):
                 self.view.update_game_list(self.model.games)
                 self.view.clear_entry()
@@ -1718,7 +3127,48 @@ class GameVotingController:
         else:
             messagebox.showerror("Error", "Game already exists or invalid name")
     
+    def queue_icon_render(self, game_name: str) -> None:
+        model = self.model
+        _load_pil_modules()  # import on the Tk thread, not concurrently in the workers
+        future = self.icon_pool.submit(model.load_game_icon, game_name, model.game_color(game_name))
+        self.icon_jobs[game_name] = future
+        future.add_done_callback(lambda f: self.icon_queue.put((model, game_name, f)))
+        if not self.icon_poll_scheduled:
+            self.icon_poll_scheduled = True
+            self.root.after(ICON_POLL_MS, self.collect_icons)
+    
+    def collect_icons(self, wait: bool = False) -> None:
+        """Turn finished renders into PhotoImages; with wait, block until all are done"""
+        self.icon_poll_scheduled = False
+        while True:
+            try:
+                model, game_name, future = self.icon_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._install_icon(model, game_name, future)
+        
+        if wait:
+            for game_name, future in list(self.icon_jobs.items()):
+                self._install_icon(self.model, game_name, future)
+        
+        if self.icon_jobs and not self.icon_poll_scheduled:
+            self.icon_poll_scheduled = True
+            self.root.after(ICON_POLL_MS, self.collect_icons)
+    
+    def _install_icon(self, model: JaxVotingSystem, game_name: str, future: Future) -> None:
+        # Ignore renders for games removed (or models restarted) while they were in flight
+        if model is not self.model or self.icon_jobs.get(game_name) is not future:
+            return
+        del self.icon_jobs[game_name]
+        try:
+            img = future.result()
+        except Exception as e:
+            print(f"Error rendering icon for {game_name}: {e}", file=sys.stderr)
+            return
+        model.game_images[game_name] = ImageTk.PhotoImage(img)
+    
     def remove_game(self, game_name: str) -> None:
+        self.icon_jobs.pop(game_name, None)
         if self.model.remove_game(game_name):
             if isinstance(self.view, SuggestionView):
                 self.view.update_game_list(self.model.games)
@@ -1728,6 +3178,7 @@ class GameVotingController:
             messagebox.showerror("Error", "You need at least 2 games to vote")
             return
         
+        self.collect_icons(wait=True)
         random.shuffle(self.model.voter_names)
         self.model.num_voters = len(self.model.voter_names)
         self.model.current_voter = 0
@@ -1738,12 +3189,17 @@ class GameVotingController:
         self.show_voting_phase()
     
     def show_voting_phase(self) -> None:
+        voter_name = self.model.voter_names[self.model.current_voter]
+        if self.current_phase == "voting" and isinstance(self.view, VotingView):
+            # Next voter: reset the visible view in place rather than hiding and rebuilding it
+            self.view.reset_for_voter(voter_name, self.model.games)
+            return
+        
         self.current_phase = "voting"
         if self.view:
             self.view.hide()
         
-        self.view = VotingView(self.root, self)
-        voter_name = self.model.voter_names[self.model.current_voter]
+        self.view = self._get_view(VotingView)
         if isinstance(self.view, VotingView):
             self.view.create_widgets(voter_name, self.model.games)
         self.view.show()
@@ -1754,7 +3210,7 @@ class GameVotingController:
     
     def place_game_in_slot(self, game_name: str, slot_index: int, slot_widget: Any) -> None:
         self.model.ranked_games[slot_index] = game_name
-        color = self.model.color_palette[self.model.games.index(game_name) % len(self.model.color_palette)]
+        color = self.model.game_color(game_name)
         slot_widget.config(
             text=game_name,
             bg=color
@@ -1771,7 +3227,7 @@ class GameVotingController:
             messagebox.showerror("Error", "Please rank all games before submitting")
             return
         
-        vote = [self.model.games.index(game) for game in ranked_games if game is not None]
+        vote = [self.model.game_ids[game] for game in ranked_games if game is not None]
         self.model.votes.append(vote)
         
         self.model.current_voter += 1
@@ -1786,30 +3242,349 @@ class GameVotingController:
         self.current_phase = "results"
         self.winner, self.round_results = self.model.calculate_jax_method_voting()
         
-        self.model.winner = self.winner
-        self.model.round_results = self.round_results
-        
-        filename = self.model.save_results()
-        
         if self.view:
             self.view.hide()
         
-        self.view = ResultsView(self.root, self)
-        self.view.create_widgets(self.winner, self.round_results, filename, 
+        # The reveal starts right away; the files are written on the writer thread
+        self.view = self._get_view(ResultsView)
+        self.view.create_widgets(self.winner, self.round_results, None, 
                                self.model.games, self.model.votes, self.model.voter_names)
         self.view.show()
+        self.save_results_async(self.view.set_save_status)
+
+    def save_results_async(self, on_saved: Callable[[Optional[str], Optional[Exception]], None]) -> None:
+        """Save on the writer thread, then call on_saved(filename, error) on the Tk thread"""
+        model = self.model
+        future = self.results_writer.submit(model.save_results)
+        
+        def check_done() -> None:
+            if not future.done():
+                self.root.after(SAVE_POLL_MS, check_done)
+            elif model is self.model:  # drop saves that finish after a restart
+                error = future.exception()
+                if error:
+                    print(f"Error saving results: {error}", file=sys.stderr)
+                on_saved(None if error else future.result(), error)
+        
+        self.root.after(SAVE_POLL_MS, check_done)
 
     def save_results(self) -> None:
-        filename = self.model.save_results()
-        if filename:
-            messagebox.showinfo("Results Saved", f"Results saved to:\n{filename}")
+        def on_saved(filename: Optional[str], error: Optional[Exception]) -> None:
+            if isinstance(self.view, ResultsView):
+                self.view.set_save_status(filename, error)
+            if error:
+                messagebox.showerror("Error", f"Could not save results:\n{error}")
+            elif filename:
+                messagebox.showinfo("Results Saved", f"Results saved to:\n{filename}")
+        
+        self.save_results_async(on_saved)
     
     def restart(self) -> None:
+        self.icon_jobs.clear()
         self.model = JaxVotingSystem()
         self.show_suggestion_phase()
 
 
-if __name__ == "__main__":
+def run_headless_tally(ballots_path: str, backend: str = "python", 
+                       results_dir: str = "voting_results") -> int:
+    """Tally a saved ballot file and write the results without loading Tk or PIL"""
+    _load_sqlite3()  # the results are recorded in the history store
+    model = JaxVotingSystem()
+    model.tally_backend = backend
+    
+    try:
+        ingest_start = time.perf_counter()
+        model.ingest_ballots(ballots_path)
+        tally_start = time.perf_counter()
+        winner, round_results = model.calculate_jax_method_voting()
+        save_start = time.perf_counter()
+        if winner is None:
+            print(f"No winner: {round_results.get('error', 'unknown error')}", file=sys.stderr)
+            return 1
+        filename = model.save_results(results_dir)
+        done = time.perf_counter()
+    except (OSError, ValueError, RuntimeError, sqlite3.Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    
+    if filename is None:
+        print("Error: no results were written", file=sys.stderr)
+        return 1
+    
+    print(f"Ballots: {len(model.votes)}  Games: {len(model.games)}  Backend: {backend}")
+    for entry in round_results.get("podium", []):
+        print(f"{entry['position']}. {entry['game']} ({entry['score']:.2f} points)")
+    print(f"Winner: {winner}")
+    print(f"Results saved to: {filename}")
+    print(f"Cold start: {(done - _STARTUP_TIME) * 1000:.1f} ms "
+          f"(startup {(ingest_start - _STARTUP_TIME) * 1000:.1f} ms, "
+          f"ingest {(tally_start - ingest_start) * 1000:.1f} ms, "
+          f"tally {(save_start - tally_start) * 1000:.1f} ms, "
+          f"save {(done - save_start) * 1000:.1f} ms)")
+    return 0
+
+
+def _diff_rounds(stored: List[Dict[str, float]], 
+                 replayed: List[Dict[str, float]]) -> Optional[Tuple[str, str]]:
+    """(where, what) of the first difference between stored and re-tallied round totals, if any"""
+    for round_num, (old, new) in enumerate(zip(stored, replayed), 1):
+        if old.keys() != new.keys():
+            return f"round {round_num}", f"games in play differ ({', '.join(sorted(old.keys() ^ new.keys()))})"
+        for game, total in old.items():
+            if not math.isclose(total, new[game], rel_tol=1e-9, abs_tol=1e-6):
+                return f"round {round_num}", f"{game} {total:.2f} stored, {new[game]:.2f} now"
+    if len(stored) != len(replayed):
+        return "round count", f"{len(stored)} stored, {len(replayed)} now"
+    return None
+
+
+def _replay_election(job: Tuple[str, Optional[int], str]) -> Dict[str, Any]:
+    """Re-tally one archived election in a worker process and diff it against its stored rounds"""
+    source, election_id, backend = job
+    label = f"{source}#{election_id}" if election_id is not None else source
+    model = JaxVotingSystem()
+    model.tally_backend = backend
+    stored_rounds: Optional[List[Dict[str, float]]] = None
+    stored_winner: Optional[str] = None
+    
+    try:
+        if election_id is not None:
+            election = HistoryStore(source).load_election(election_id)
+            if election is None:
+                raise ValueError(f"no election {election_id} in {source}")
+            for game in election["games"]:
+                model._register_game(game)
+            model.votes = election["votes"]
+            stored_rounds = [round_data.get("game_totals", {}) for round_data in election["rounds"]]
+            stored_winner = election["winner"]
+        elif source.lower().endswith(BallotArchive.EXTENSION):
+            archive = BallotArchive.open(source)  # opened once for both the ballots and the rounds
+            model.ingest_ballots(archive)
+            stored_rounds = [archive.round_totals(i) for i in range(archive.num_rounds)]
+        else:
+            model.ingest_ballots(source)
+        winner, round_results = model.calculate_jax_method_voting()
+    except Exception as e:  # one bad election must not abort the whole batch in pool.map
+        return {"source": label, "error": f"{type(e).__name__}: {e}"}
+    
+    divergence = None
+    if stored_rounds is not None:
+        replayed = [round_data["game_totals"] for round_data in round_results.get("rounds", [])]
+        divergence = _diff_rounds(stored_rounds, replayed)
+        if divergence is None and stored_winner is not None and stored_winner != winner:
+            divergence = ("winner", f"{stored_winner} stored, {winner} now")
+    return {"source": label, "winner": winner, "compared": stored_rounds is not None, 
+            "divergence": divergence}
+
+
+def _replay_jobs(sources: List[str], backend: str) -> List[Tuple[str, Optional[int], str]]:
+    """Expand files, directories (their .jaxb archives) and history stores into replay jobs"""
+    jobs = []
+    for source in sources:
+        if os.path.isdir(source):
+            for directory, _, filenames in sorted(os.walk(source)):
+                jobs.extend((os.path.join(directory, filename), None, backend) 
+                            for filename in sorted(filenames) 
+                            if filename.lower().endswith(BallotArchive.EXTENSION))
+        elif source.endswith(HistoryStore.FILENAME):
+            jobs.extend((source, row["election_id"], backend) 
+                        for row in HistoryStore(source).elections_between(""))
+        else:
+            jobs.append((source, None, backend))
+    return jobs
+
+
+def run_replay(sources: List[str], backend: str = "python", workers: Optional[int] = None) -> int:
+    """Re-tally archived elections in a process pool and summarize any that no longer match"""
+    from concurrent.futures import ProcessPoolExecutor
+    _load_sqlite3()
+    start = time.perf_counter()
+    try:
+        jobs = _replay_jobs(sources, backend)
+    except sqlite3.Error as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    if not jobs:
+        print("No elections to replay", file=sys.stderr)
+        return 1
+    
+    workers = workers or os.cpu_count() or 1
+    # Thousands of small elections: hand each worker a few batches rather than one job at a time
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_replay_election, jobs, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+    
+    failed = [result for result in results if "error" in result]
+    diverged = [result for result in results if result.get("divergence")]
+    not_compared = sum(1 for result in results if "error" not in result and not result["compared"])
+    matched = len(results) - len(failed) - len(diverged) - not_compared
+    
+    divergences_by_place: Dict[str, int] = defaultdict(int)
+    for result in diverged:
+        where, what = result["divergence"]
+        divergences_by_place[where] += 1
+        print(f"DIVERGED {result['source']}: {where}: {what}")
+    for result in failed:
+        print(f"FAILED {result['source']}: {result['error']}")
+    if diverged:
+        print("First divergence at: " + ", ".join(f"{where} ({count})" 
+                                                  for where, count in sorted(divergences_by_place.items())))
+    print(f"Replayed {len(results)} elections in {elapsed:.2f} s ({backend} backend, pool of {workers}): "
+          f"{matched} matched, {len(diverged)} diverged, "
+          f"{not_compared} without stored rounds, {len(failed)} failed")
+    return 1 if diverged or failed else 0
+
+
+def show_history(results_dir: str = "voting_results", game: Optional[str] = None, 
+                 voter: Optional[str] = None, since: Optional[str] = None, 
+                 until: Optional[str] = None, limit: int = 200) -> int:
+    """Print a game's or voter's record, or the elections in a date range, from the history store"""
+    _load_sqlite3()
+    history = HistoryStore(os.path.join(results_dir, HistoryStore.FILENAME))
+    start = time.perf_counter()
+    try:
+        if game is not None:
+            rows = history.game_history(game, limit)
+        elif voter is not None:
+            rows = history.voter_history(voter, limit)
+        else:
+            rows = history.elections_between(since or "", until or "9999")
+    except sqlite3.Error as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    elapsed = (time.perf_counter() - start) * 1000
+    
+    for row in rows:
+        if game is not None:
+            place = f"#{row['position']}" if row['position'] else f"out in round {row['eliminated_round']}"
+            score = f"{row['final_score']:.2f}" if row['final_score'] is not None else "-"
+            print(f"{row['saved_at']}  {place:<16} {score:>8} points  winner: {row['winner']}")
+        elif voter is not None:
+            print(f"{row['saved_at']}  ranked first: {row['top_choice']}  winner: {row['winner']}")
+        else:
+            print(f"{row['saved_at']}  #{row['election_id']}  winner: {row['winner']}  ({row['results_file']})")
+    if game is not None:
+        wins = sum(1 for row in rows if row['position'] == 1)
+        print(f"{game}: {wins} wins in {len(rows)} elections")
+    elections = len({row['election_id'] for row in rows})
+    if voter is not None:
+        print(f"{len(rows)} ballots in {elections} elections ({elapsed:.1f} ms)")
+    else:
+        print(f"{elections} elections ({elapsed:.1f} ms)")
+    return 0
+
+
+def benchmark_icon_text(repeats: int = 200) -> int:
+    """Compare single-pass and nine-pass outlined icon rendering across name lengths"""
+    model = JaxVotingSystem()
+    color = model.color_palette[0]
+    names = ["Catan", "Ticket to Ride", "Twilight Imperium Fourth", 
+             "Star Wars Rebellion Rise of the Empire", 
+             "Through the Ages A New Story of Civilization Extended"]
+    
+    print(f"{'name length':>11}  {'nine-pass':>10}  {'stroked':>10}  {'speedup':>7}")
+    for name in names:
+        timings = []
+        for draw_text in (_draw_outlined_text_multipass, _draw_outlined_text):
+            model.render_game_icon(name, color, draw_text)  # warm font and width caches
+            start = time.perf_counter()
+            for _ in range(repeats):
+                model.render_game_icon(name, color, draw_text)
+            timings.append((time.perf_counter() - start) / repeats * 1000)
+        print(f"{len(name):>11}  {timings[0]:>7.3f} ms  {timings[1]:>7.3f} ms  {timings[0] / timings[1]:>6.1f}x")
+    return 0
+
+
+def _print_startup_profile(stages: List[Tuple[str, float]]) -> None:
+    print("Startup profile:")
+    previous = _STARTUP_TIME
+    for stage, stamp in stages:
+        print(f"  {stage:<18}{(stamp - previous) * 1000:8.1f} ms")
+        previous = stamp
+    print(f"  {'total':<18}{(previous - _STARTUP_TIME) * 1000:8.1f} ms")
+    print(f"  PIL loaded: {'PIL' in sys.modules}, NumPy loaded: {'numpy' in sys.modules}")
+
+
+def _print_drag_profile(samples: List[Tuple[float, int]]) -> None:
+    latencies = sorted(latency for latency, _ in samples)
+    events = sum(count for _, count in samples)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"Drag: {events} motion events in {len(samples)} frames, "
+          f"latency mean {sum(latencies) / len(latencies):.1f} ms, "
+          f"p95 {p95:.1f} ms, max {latencies[-1]:.1f} ms")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Boys Night game voting with the Jax method")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    tally_parser = subparsers.add_parser("tally", help="tally a saved ballot file without the GUI")
+    tally_parser.add_argument("ballots", help="CSV or JSONL file with one ranked ballot per line, or a .jaxb ballot archive")
+    tally_parser.add_argument("--backend", choices=["python", "numpy"], default="python",
+                              help="tally engine to use (default: python)")
+    tally_parser.add_argument("--results-dir", default="voting_results",
+                              help="directory for the txt/csv results (default: voting_results)")
+    
+    replay_parser = subparsers.add_parser("replay", help="re-tally archived elections and diff them against their stored rounds")
+    replay_parser.add_argument("sources", nargs="+",
+                               help=".jaxb archives, directories of them, history.sqlite3 stores, "
+                                    "or CSV/JSONL ballot files (tallied without a diff)")
+    replay_parser.add_argument("--backend", choices=["python", "numpy"], default="python",
+                               help="tally engine to use (default: python)")
+    replay_parser.add_argument("--workers", type=int, default=None,
+                               help="worker processes (default: one per CPU)")
+    
+    history_parser = subparsers.add_parser("history", help="query past elections from the history store")
+    history_query = history_parser.add_mutually_exclusive_group()
+    history_query.add_argument("--game", help="show how this game placed in past elections")
+    history_query.add_argument("--voter", help="show this voter's first choices in past elections")
+    history_parser.add_argument("--since", help="list elections saved on or after this ISO date")
+    history_parser.add_argument("--until", help="list elections saved before this ISO date")
+    history_parser.add_argument("--limit", type=int, default=200,
+                                help="most recent elections to show for --game/--voter (default: 200)")
+    history_parser.add_argument("--results-dir", default="voting_results",
+                                help="directory holding history.sqlite3 (default: voting_results)")
+    
+    bench_parser = subparsers.add_parser("bench-icons", help="time outlined icon text rendering")
+    bench_parser.add_argument("--repeats", type=int, default=200,
+                              help="renders per name and method (default: 200)")
+    
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print import and first-frame timings when the GUI starts")
+    parser.add_argument("--profile-drag", action="store_true",
+                        help="print motion event and frame latency statistics after each drag")
+    parser.add_argument("--debug-timers", action="store_true",
+                        help="print the pending results animation callback count as it changes")
+    
+    args = parser.parse_args(argv)
+    if args.command == "tally":
+        return run_headless_tally(args.ballots, args.backend, args.results_dir)
+    if args.command == "replay":
+        return run_replay(args.sources, args.backend, args.workers)
+    if args.command == "history":
+        return show_history(args.results_dir, args.game, args.voter, args.since, args.until, args.limit)
+    if args.command == "bench-icons":
+        return benchmark_icon_text(args.repeats)
+    
+    stages = [("module import", time.perf_counter())]
+    _load_tk_modules()
+    stages.append(("import tkinter", time.perf_counter()))
     root = Tk()
+    stages.append(("create Tk root", time.perf_counter()))
     app = GameVotingController(root)
+    stages.append(("build first view", time.perf_counter()))
+    
+    if args.profile_drag:
+        app.drag_latency_hook = _print_drag_profile
+    app.debug_timers = args.debug_timers
+    if args.profile_startup:
+        # Idle callbacks run after Tk's pending redraws, i.e. once the first frame is up
+        root.after_idle(lambda: _print_startup_profile(stages + [("first frame", time.perf_counter())]))
+    
     root.mainloop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import boys_night_vote_Jax as jax
+
+
+@pytest.fixture
+def tallied_model():
+    """Build a model from ballots and run the tally, as the results and archive tests need"""
+    def tally(ballots):
+        model = jax.JaxVotingSystem()
+        model.ingest_ballots(ballots)
+        model.calculate_jax_method_voting()
+        return model
+    return tally
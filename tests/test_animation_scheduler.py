@@ -0,0 +1,99 @@
+import pytest
+
+import boys_night_vote_Jax as jax
+
+
+class StubClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class StubRoot:
+    """Records after() callbacks instead of running a Tk loop"""
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.pending[f"after#{self.next_id}"] = callback
+        return f"after#{self.next_id}"
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def fire(self):
+        """Run the callbacks queued so far, like one pass of the event loop"""
+        pending, self.pending = self.pending, {}
+        for callback in pending.values():
+            callback()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = StubClock()
+    monkeypatch.setattr(jax.time, "perf_counter", clock)
+    return clock
+
+
+def linear(progress):
+    return progress
+
+
+def test_progress_follows_the_clock_not_the_tick_count(clock):
+    root = StubRoot()
+    scheduler = jax.AnimationScheduler(root)
+    steps, done = [], []
+    scheduler.tween(0.2, steps.append, lambda: done.append(True), delay=0.05, easing=linear)
+    
+    ticks = 0
+    while root.pending:
+        clock.now += 0.04  # a slow machine: 40 ms per frame instead of 16
+        root.fire()
+        ticks += 1
+    
+    assert ticks == 7
+    assert steps == pytest.approx([0.15, 0.35, 0.55, 0.75, 0.95, 1.0])
+    assert done == [True]
+    assert scheduler.tweens == [] and scheduler.after_id is None
+
+
+def test_one_tick_is_queued_for_all_tweens(clock):
+    root = StubRoot()
+    scheduler = jax.AnimationScheduler(root)
+    for duration in (0.1, 0.3, 0.5):
+        scheduler.tween(duration, lambda progress: None)
+    assert len(root.pending) == 1
+    
+    clock.now += 0.2
+    root.fire()
+    assert len(scheduler.tweens) == 2 and len(root.pending) == 1
+
+
+def test_cancel_all_leaves_nothing_queued(clock):
+    root = StubRoot()
+    scheduler = jax.AnimationScheduler(root)
+    steps = []
+    scheduler.tween(1.0, steps.append)
+    scheduler.tween(1.0, steps.append, delay=0.5)
+    scheduler.cancel_all()
+    assert root.pending == {} and scheduler.tweens == []
+    clock.now += 2.0
+    root.fire()
+    assert steps == []
+
+
+def test_a_tween_cancelled_mid_tick_is_not_stepped(clock):
+    root = StubRoot()
+    scheduler = jax.AnimationScheduler(root)
+    steps = []
+    second = None
+    first = scheduler.tween(0.1, steps.append, lambda: scheduler.cancel(second), easing=linear)
+    second = scheduler.tween(0.1, lambda progress: steps.append(("second", progress)))
+    clock.now += 0.5
+    root.fire()
+    assert steps == [1.0]
+    assert first not in scheduler.tweens and root.pending == {}
@@ -0,0 +1,105 @@
+import os
+
+import pytest
+
+import boys_night_vote_Jax as jax
+
+
+def write_archive(tmp_path, model, name="election.jaxb"):
+    path = tmp_path / name
+    path.write_bytes(jax.BallotArchive.encode(model.games, model.votes, model.round_results["rounds"]))
+    return path
+
+
+@pytest.mark.parametrize("ballots", [
+    [["A", "B", "C", "D", "E"], ["E", "D", "C", "B", "A"], ["C", "A", "E", "B", "D"]],
+    [["A", "B", "C", "D", "E"], ["D"], ["C", "A"]],
+])
+def test_round_trip(tmp_path, ballots, tallied_model):
+    model = tallied_model(ballots)
+    archive = jax.BallotArchive.open(str(write_archive(tmp_path, model)))
+    assert archive.games == model.games
+    assert [list(ballot) for ballot in archive.votes] == [list(ballot) for ballot in model.votes]
+    assert [archive.round_totals(i) for i in range(archive.num_rounds)] == \
+        [round_data["game_totals"] for round_data in model.round_results["rounds"]]
+
+
+@pytest.mark.parametrize("ragged", [False, True])
+def test_truncated_archive_is_rejected(tmp_path, ragged, tallied_model):
+    ballots = [["A", "B", "C", "D", "E"], ["E", "D", "C", "B", "A"]]
+    if ragged:
+        ballots.append(["C"])
+    data = write_archive(tmp_path, tallied_model(ballots)).read_bytes()
+    truncated = tmp_path / "truncated.jaxb"
+    for size in range(len(data) - 1, -1, -1):
+        truncated.write_bytes(data[:size])
+        with pytest.raises(ValueError):
+            jax.BallotArchive.open(str(truncated))
+
+
+def test_unknown_game_id_is_rejected(tmp_path, tallied_model):
+    model = tallied_model([["A", "B", "C", "D"], ["D", "C", "B", "A"]])
+    corrupt = jax.BallotArchive.encode(model.games, jax.BallotStore([[0, 1, 2, 9], [3, 2, 1, 0]]))
+    path = tmp_path / "corrupt.jaxb"
+    path.write_bytes(corrupt)
+    with pytest.raises(ValueError):
+        jax.BallotArchive.open(str(path))
+
+
+
+@pytest.mark.parametrize("rows", [
+    [[0, 1, 2, 3], [3, 2, 3, 0]],
+    [[0, 1, 2, 3], [2, 2], [1]],
+])
+def test_repeated_game_id_is_rejected(tmp_path, rows):
+    path = tmp_path / "corrupt.jaxb"
+    path.write_bytes(jax.BallotArchive.encode(["A", "B", "C", "D"], jax.BallotStore(rows)))
+    with pytest.raises(ValueError, match="twice"):
+        jax.BallotArchive.open(str(path))
+
+
+def test_ragged_padding_is_not_a_repeat(tmp_path):
+    path = tmp_path / "ragged.jaxb"
+    path.write_bytes(jax.BallotArchive.encode(["A", "B", "C", "D"], jax.BallotStore([[0, 1, 2, 3], [2], [1, 0]])))
+    assert [list(ballot) for ballot in jax.BallotArchive.open(str(path)).votes] == [[0, 1, 2, 3], [2], [1, 0]]
+
+
+def test_tally_reports_truncated_archive(tmp_path, capsys, tallied_model):
+    data = write_archive(tmp_path, tallied_model([["A", "B", "C", "D"], ["B", "A", "D", "C"]])).read_bytes()
+    truncated = tmp_path / "truncated.jaxb"
+    truncated.write_bytes(data[:jax.BallotArchive.HEADER.size + 3])
+    assert jax.main(["tally", str(truncated), "--results-dir", str(tmp_path / "out")]) == 1
+    assert "corrupt" in capsys.readouterr().err
+
+
+def test_zero_ballot_archive_round_trips(tmp_path):
+    path = tmp_path / "empty.jaxb"
+    path.write_bytes(jax.BallotArchive.encode(["A", "B", "C"], jax.BallotStore()))
+    archive = jax.BallotArchive.open(str(path))
+    assert archive.games == ["A", "B", "C"]
+    assert len(archive.votes) == 0 and list(archive.votes) == []
+    assert archive.num_rounds == 0
+
+
+def test_error_results_are_not_archived(tmp_path):
+    model = jax.JaxVotingSystem()
+    for game in ("A", "B", "C"):
+        model.add_game(game)
+    winner, round_results = model.calculate_jax_method_voting()
+    assert winner is None and "error" in round_results
+    
+    text_file = model.save_results(str(tmp_path))
+    assert os.path.exists(text_file)
+    assert not os.path.exists(text_file[:-4] + jax.BallotArchive.EXTENSION)
+    assert not (tmp_path / jax.HistoryStore.FILENAME).exists()
+
+
+def test_archive_ballots_copy_on_first_append(tmp_path, tallied_model):
+    path = write_archive(tmp_path, tallied_model([["A", "B", "C"], ["C", "B", "A"]]))
+    original = path.read_bytes()
+    votes = jax.BallotArchive.open(str(path)).votes
+    votes.append([1, 0])
+    votes.extend(jax.BallotStore([[2]]))
+    assert [list(ballot) for ballot in votes] == [[0, 1, 2], [2, 1, 0], [1, 0], [2]]
+    assert (votes.min_length, votes.max_length) == (1, 3)
+    assert path.read_bytes() == original
@@ -0,0 +1,38 @@
+import os
+
+import boys_night_vote_Jax as jax
+
+
+def write_ballots(tmp_path, rows):
+    path = tmp_path / "ballots.csv"
+    path.write_text("".join(",".join(row) + "\n" for row in rows), encoding="utf-8")
+    return str(path)
+
+
+def test_majority_winner_is_kept_on_model():
+    model = jax.JaxVotingSystem()
+    model.ingest_ballots([["A", "B", "C", "D"]] + [["A"]] * 5)
+    winner, round_results = model.calculate_jax_method_voting()
+    assert winner == "A"
+    assert len(round_results["rounds"]) == 1
+    assert model.winner == "A"
+    assert model.round_results is round_results
+
+
+def test_headless_tally_saves_majority_winner(tmp_path, capsys):
+    ballots = write_ballots(tmp_path, [["A", "B", "C", "D"]] + [["A"]] * 5)
+    results_dir = str(tmp_path / "results")
+    assert jax.run_headless_tally(ballots, results_dir=results_dir) == 0
+    saved = [name for name in os.listdir(results_dir) if name.endswith(".txt")]
+    assert len(saved) == 1
+    with open(os.path.join(results_dir, saved[0]), encoding="utf-8") as f:
+        assert "Overall Winner: A" in f.read()
+    assert "Results saved to: None" not in capsys.readouterr().out
+
+
+def test_headless_tally_without_ballots_fails(tmp_path):
+    ballots = tmp_path / "empty.csv"
+    ballots.write_text("", encoding="utf-8")
+    results_dir = tmp_path / "results"
+    assert jax.run_headless_tally(str(ballots), results_dir=str(results_dir)) == 1
+    assert not results_dir.exists()
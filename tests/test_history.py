@@ -0,0 +1,71 @@
+import pytest
+
+import boys_night_vote_Jax as jax
+
+
+def save_election(results_dir, ballots):
+    model = jax.JaxVotingSystem()
+    model.ingest_ballots(ballots)
+    model.calculate_jax_method_voting()
+    model.save_results(results_dir)
+
+
+def test_voter_history_counts_elections_not_ballots(tmp_path, capsys):
+    results_dir = str(tmp_path)
+    for _ in range(3):
+        save_election(results_dir, [
+            {"voter": "Ann", "ranking": ["A", "B", "C", "D"]},
+            {"voter": "Ann", "ranking": ["D", "C", "B", "A"]},
+            {"voter": "Bo", "ranking": ["B", "A", "D", "C"]},
+        ])
+    
+    history = jax.HistoryStore(str(tmp_path / jax.HistoryStore.FILENAME))
+    rows = history.voter_history("Ann", limit=2)
+    assert len(rows) == 4
+    assert len({row["election_id"] for row in rows}) == 2
+    assert [row["top_choice"] for row in rows[:2]] == ["A", "D"]
+    
+    assert jax.show_history(results_dir, voter="Ann", limit=2) == 0
+    assert "4 ballots in 2 elections" in capsys.readouterr().out
+
+
+def test_game_history_newest_first(tmp_path):
+    save_election(str(tmp_path), [["A", "B", "C", "D"], ["A", "C", "B", "D"]])
+    save_election(str(tmp_path), [["B", "A", "C", "D"], ["B", "C", "A", "D"]])
+    history = jax.HistoryStore(str(tmp_path / jax.HistoryStore.FILENAME))
+    assert [row["winner"] for row in history.game_history("A")] == ["B", "A"]
+
+
+def test_schema_is_created_once_per_store(tmp_path, monkeypatch):
+    save_election(str(tmp_path), [["A", "B", "C", "D"], ["A", "C", "B", "D"]])
+    scripts = []
+    real_connect = jax.sqlite3.connect
+    
+    def connect(*args, **kwargs):
+        connection = real_connect(*args, **kwargs)
+        connection.set_trace_callback(scripts.append)
+        return connection
+    
+    monkeypatch.setattr(jax.sqlite3, "connect", connect)
+    save_election(str(tmp_path), [["B", "A", "C", "D"], ["B", "C", "A", "D"]])
+    history = jax.HistoryStore(str(tmp_path / jax.HistoryStore.FILENAME))
+    assert len(history.game_history("A")) == 2
+    assert scripts and not any("CREATE" in statement for statement in scripts)
+
+
+@pytest.mark.parametrize("statement", [
+    "UPDATE elections SET winner = 'D'",
+    "DELETE FROM elections",
+    "UPDATE election_games SET position = 1",
+    "DELETE FROM election_games",
+    "UPDATE election_voters SET top_choice = 'D'",
+    "DELETE FROM election_voters",
+])
+def test_history_is_append_only(tmp_path, statement):
+    save_election(str(tmp_path), [{"voter": "Ann", "ranking": ["A", "B", "C", "D"]}, ["B", "A", "C", "D"]])
+    connection = jax.sqlite3.connect(str(tmp_path / jax.HistoryStore.FILENAME))
+    try:
+        with pytest.raises(jax.sqlite3.IntegrityError, match="append-only"):
+            connection.execute(statement)
+    finally:
+        connection.close()
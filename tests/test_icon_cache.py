@@ -0,0 +1,18 @@
+import os
+
+import pytest
+
+import boys_night_vote_Jax as jax
+
+pytest.importorskip("PIL")
+
+
+def test_load_game_icon_uses_declared_key(tmp_path):
+    model = jax.JaxVotingSystem()
+    model.icon_cache = jax.IconCache(str(tmp_path))
+    model.load_game_icon("Ticket to Ride", "#FF0000")
+    
+    width, height, font_size = model._icon_layout("Ticket to Ride")
+    key = jax.IconCache.key("Ticket to Ride", "#FF0000", width, height, jax.ICON_FONT_PATH, font_size)
+    assert os.listdir(tmp_path) == [f"{key}.png"]
+    assert model.icon_cache.load(key) is not None
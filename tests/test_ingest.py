@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+import boys_night_vote_Jax as jax
+
+
+def write_jsonl(tmp_path, rows):
+    path = tmp_path / "ballots.jsonl"
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+    return str(path)
+
+
+def test_voter_names_stay_positional_with_anonymous_rows(tmp_path):
+    model = jax.JaxVotingSystem()
+    model.ingest_ballots(write_jsonl(tmp_path, [
+        ["A", "B", "C", "D"],
+        {"voter": "Bob", "ranking": ["D", "C", "B", "A"]},
+        {"ranking": ["B", "A", "C", "D"]},
+        {"voter": "Cy", "ranking": ["C", "D", "A", "B"]},
+    ]))
+    assert model.voter_names == [None, "Bob", None, "Cy"]
+    
+    model.calculate_jax_method_voting()
+    model.save_results(str(tmp_path / "results"))
+    history = jax.HistoryStore(str(tmp_path / "results" / jax.HistoryStore.FILENAME))
+    assert [row["top_choice"] for row in history.voter_history("Bob")] == ["D"]
+    assert [row["ballot"] for row in history.voter_history("Cy")] == [3]
+
+
+def test_invalid_row_leaves_model_untouched():
+    model = jax.JaxVotingSystem()
+    model.ingest_ballots([{"voter": "Ann", "ranking": ["A", "B", "C"]}])
+    before = (list(model.games), [list(ballot) for ballot in model.votes], list(model.voter_names))
+    
+    with pytest.raises(ValueError, match="Ballot 4"):
+        model.ingest_ballots([["C", "D", "E"], ["E", "F"], ["A", "A"]])
+    assert (list(model.games), [list(ballot) for ballot in model.votes], list(model.voter_names)) == before
+    assert set(model.game_ids) == {"A", "B", "C"}
+
+
+def test_digit_titles_are_names():
+    model = jax.JaxVotingSystem()
+    model.ingest_ballots([["2048", "Catan", "1"], ["Catan", "1", "2048"]])
+    assert model.games == ["2048", "Catan", "1"]
+    assert [list(ballot) for ballot in model.votes] == [[0, 1, 2], [1, 2, 0]]
+
+
+def test_json_integers_are_indices(tmp_path):
+    model = jax.JaxVotingSystem()
+    model.ingest_ballots([["A", "B", "C"]])
+    model.ingest_ballots(write_jsonl(tmp_path, [[2, 0, 1], {"ranking": [1, "C", 0]}]))
+    assert [list(ballot) for ballot in model.votes] == [[0, 1, 2], [2, 0, 1], [1, 2, 0]]
+    with pytest.raises(ValueError, match="out of range"):
+        model.ingest_ballots([[0, 3]])
+
+
+def test_archive_with_digit_titles_appends_by_name(tmp_path):
+    source = jax.JaxVotingSystem()
+    source.ingest_ballots([["7 Wonders", "2048", "Catan"], ["2048", "Catan", "7 Wonders"]])
+    archive = tmp_path / "election.jaxb"
+    archive.write_bytes(jax.BallotArchive.encode(source.games, source.votes))
+    
+    model = jax.JaxVotingSystem()
+    model.ingest_ballots([["Catan", "2048", "7 Wonders"]])
+    model.ingest_ballots(str(archive))
+    assert model.games == ["Catan", "2048", "7 Wonders"]
+    assert [[model.games[game_id] for game_id in ballot] for ballot in model.votes[1:]] == \
+        [["7 Wonders", "2048", "Catan"], ["2048", "Catan", "7 Wonders"]]
+
+
+@pytest.mark.parametrize("line", [
+    5,
+    "A",
+    {"ranking": True},
+    {"voter": "Ann", "ranking": "A"},
+    None,
+])
+def test_non_list_rows_are_rejected(tmp_path, line):
+    model = jax.JaxVotingSystem()
+    with pytest.raises(ValueError, match="Ballot 2: expected a non-empty list"):
+        model.ingest_ballots(write_jsonl(tmp_path, [["A", "B"], line]))
+    assert model.games == [] and len(model.votes) == 0
+
+
+@pytest.mark.parametrize("entry", [["A"], {"game": "A"}, 1.0, True, None])
+def test_non_name_entries_are_rejected(tmp_path, entry):
+    model = jax.JaxVotingSystem()
+    with pytest.raises(ValueError, match="Ballot 1: expected a game name or index"):
+        model.ingest_ballots(write_jsonl(tmp_path, [[entry, "B"]]))
+    assert model.games == []
+
+
+def test_tally_reports_malformed_jsonl(tmp_path, capsys):
+    ballots = write_jsonl(tmp_path, [["A", "B", "C"], 5])
+    assert jax.main(["tally", ballots, "--results-dir", str(tmp_path / "out")]) == 1
+    assert "Ballot 2" in capsys.readouterr().err
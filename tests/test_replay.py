@@ -0,0 +1,58 @@
+import random
+
+import boys_night_vote_Jax as jax
+
+
+def archive_elections(directory, count, seed=11):
+    rng = random.Random(seed)
+    games = [f"G{i}" for i in range(8)]
+    directory.mkdir()
+    for n in range(count):
+        model = jax.JaxVotingSystem()
+        for game in rng.sample(games, rng.randint(4, 7)):
+            model.add_game(game)
+        for _ in range(5):
+            ballot = list(range(len(model.games)))
+            rng.shuffle(ballot)
+            model.votes.append(ballot)
+        model.calculate_jax_method_voting()
+        (directory / f"e{n:03d}.jaxb").write_bytes(
+            jax.BallotArchive.encode(model.games, model.votes, model.round_results["rounds"]))
+
+
+def test_replay_matches_archives(tmp_path, capsys):
+    archive_elections(tmp_path / "archive", 20)
+    assert jax.run_replay([str(tmp_path / "archive")], workers=2) == 0
+    assert "20 matched, 0 diverged" in capsys.readouterr().out
+
+
+def test_corrupt_archive_fails_alone(tmp_path, capsys):
+    archive_elections(tmp_path / "archive", 20)
+    data = (tmp_path / "archive" / "e005.jaxb").read_bytes()
+    (tmp_path / "archive" / "e005.jaxb").write_bytes(data[:len(data) // 2])
+    (tmp_path / "archive" / "e006.jaxb").write_bytes(b"JAXB" + bytes(60))
+    
+    assert jax.run_replay([str(tmp_path / "archive")], workers=2) == 1
+    out = capsys.readouterr().out
+    assert "18 matched, 0 diverged, 0 without stored rounds, 2 failed" in out
+    assert "FAILED " + str(tmp_path / "archive" / "e005.jaxb") in out
+
+
+def test_missing_history_election_fails_alone():
+    result = jax._replay_election(("missing/history.sqlite3", 3, "python"))
+    assert "error" in result
+
+
+def test_replay_opens_each_archive_once(tmp_path, monkeypatch):
+    archive_elections(tmp_path / "archive", 1)
+    opened = []
+    real_open = jax.BallotArchive.open
+    
+    def counting_open(path):
+        opened.append(path)
+        return real_open(path)
+    
+    monkeypatch.setattr(jax.BallotArchive, "open", counting_open)
+    result = jax._replay_election((str(tmp_path / "archive" / "e000.jaxb"), None, "python"))
+    assert result["compared"] and result["divergence"] is None
+    assert len(opened) == 1
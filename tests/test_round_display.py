@@ -0,0 +1,150 @@
+import itertools
+
+import boys_night_vote_Jax as jax
+
+
+ROUND = {"round": 3, "game_totals": {"Catan": 12.5, "Azul": 30.0, "Uno": 7.5}, "eliminated": "Uno"}
+
+
+def test_rows_are_precomputed_from_highest_score():
+    display = jax.RoundDisplay(ROUND, False, lambda game: f"color-{game}")
+    assert display.header == "Round 3"
+    assert display.total_text == "Total Points: 50.0"
+    assert display.scores == [("Azul", 30.0, 60.0), ("Catan", 12.5, 25.0), ("Uno", 7.5, 15.0)]
+    assert display.rows == [
+        ("Azul", "color-Azul", 1.0, "Azul: 30.0 points (60.0%)"),
+        ("Catan", "color-Catan", 12.5 / 30.0, "Catan: 12.5 points (25.0%)"),
+        ("Uno", "color-Uno", 0.25, "Uno: 7.5 points (15.0%)"),
+    ]
+    assert display.row_of == {"Azul": 0, "Catan": 1, "Uno": 2}
+    assert display.explanation == "Uno was eliminated for having the lowest score (7.5 points)"
+
+
+def test_explanation_lines_are_wrapped_once_per_width():
+    display = jax.RoundDisplay(ROUND, False, str)
+    lines = display.explanation_lines(200)
+    assert all(len(line) <= 20 for line in lines) and " ".join(lines) == display.explanation
+    assert display.explanation_lines(205) is lines  # same 20-character width
+    assert display.explanation_lines(400) is not lines
+
+
+class StubFont:
+    def __init__(self, **options):
+        self.options = options
+
+    def cget(self, option):
+        return self.options[option]
+
+    def configure(self, **options):
+        self.options.update(options)
+
+
+class StubCanvas:
+    """Records canvas items so a test can see which are created, moved or deleted"""
+    def __init__(self):
+        self.items = {}
+        self.ids = itertools.count(1)
+        self.created = 0
+
+    def __getattr__(self, name):
+        if not name.startswith("create_"):
+            raise AttributeError(name)
+        def create(*coords, tags=(), **options):
+            item = next(self.ids)
+            self.items[item] = dict(options, coords=list(coords), tags=set(tags))
+            self.created += 1
+            return item
+        return create
+
+    def _select(self, tag):
+        return [item for item, options in self.items.items() 
+                if item == tag or tag == "all" or tag in options["tags"]]
+
+    def coords(self, item, *coords):
+        if coords:
+            self.items[item]["coords"] = list(coords)
+        return self.items[item]["coords"]
+
+    def itemconfigure(self, tag, **options):
+        for item in self._select(tag):
+            self.items[item].update(options)
+
+    def delete(self, *tags):
+        for tag in tags:
+            if tag == "all":
+                raise AssertionError("round navigation must not clear the canvas")
+            for item in self._select(tag):
+                del self.items[item]
+
+    def winfo_width(self):
+        return 1920
+
+    def winfo_height(self):
+        return 1080
+
+
+class StubRoot:
+    def after(self, ms, callback):
+        return f"after#{id(callback)}"
+
+    def after_cancel(self, after_id):
+        pass
+
+
+class StubController:
+    debug_timers = False
+
+    def __init__(self):
+        self.root = StubRoot()
+
+    def get_game_color(self, game):
+        return "red"
+
+
+class StubLabel:
+    def config(self, **options):
+        self.options = options
+
+
+def test_round_navigation_reuses_canvas_items(monkeypatch):
+    monkeypatch.setattr(jax, "Frame", lambda *args, **kwargs: None, raising=False)
+    monkeypatch.setattr(jax, "tkfont", type("tkfont", (), {"Font": StubFont}), raising=False)
+    model = jax.JaxVotingSystem()
+    games = [f"Game {i}" for i in range(8)]
+    model.ingest_ballots([games, games[::-1], games[3:] + games[:3]])
+    winner, round_results = model.calculate_jax_method_voting()
+    
+    controller = StubController()
+    view = jax.ResultsView(controller.root, controller)
+    view.sprites.get = lambda key, render: key
+    view.results_canvas = canvas = StubCanvas()
+    view.round_counter = StubLabel()
+    view._create_navigation_controls = lambda: None
+    view.winner, view.round_results, view.games = winner, round_results, model.games
+    view.round_displays = view._build_round_displays()
+    rounds = len(view.round_displays)
+    assert rounds > 2
+    
+    view.animate_elimination_round()
+    for _ in range(rounds - 1):
+        view.next_round()
+    created = canvas.created
+    items = dict(view.round_items)
+    
+    for _ in range(5):
+        for _ in range(rounds - 1):
+            view.previous_round()
+        for _ in range(rounds - 1):
+            view.next_round()
+    assert canvas.created == created
+    assert view.round_items == items
+    
+    # Only the current round's text is visible
+    view.current_round_index = 1
+    view.animate_elimination_round()
+    display = view.round_displays[1]
+    visible = [options for options in canvas.items.values() if options.get("state") != "hidden"]
+    assert canvas.items[view.round_items["header"]]["text"] == display.header
+    visible_text = {options["text"] for options in visible if "text" in options}
+    assert visible_text == {display.header, display.total_text, *display.explanation_lines(1880), 
+                            *(row[3] for row in display.rows)}
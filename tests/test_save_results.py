@@ -0,0 +1,81 @@
+import os
+import stat
+from datetime import datetime
+
+import pytest
+
+import boys_night_vote_Jax as jax
+
+
+class FrozenDateTime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 10, 18, 20, 30, 0)
+
+
+def test_saves_in_the_same_second_do_not_overwrite(tmp_path, monkeypatch, tallied_model):
+    monkeypatch.setattr(jax, "datetime", FrozenDateTime)
+    first = tallied_model([["A", "B", "C", "D"], ["B", "A", "C", "D"]])
+    second = tallied_model([["D", "C", "B", "A"], ["C", "D", "B", "A"]])
+    first_file = first.save_results(str(tmp_path))
+    second_file = second.save_results(str(tmp_path))
+    
+    assert first_file != second_file
+    assert os.path.basename(first_file) == "jax_method_results_20261018_203000.txt"
+    assert os.path.basename(second_file) == "jax_method_results_20261018_203000_2.txt"
+    with open(first_file, encoding="utf-8") as f:
+        assert "Overall Winner: A" in f.read()
+    for extension in (".csv", jax.BallotArchive.EXTENSION):
+        assert os.path.exists(second_file[:-4] + extension)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_results_files_follow_the_umask(tmp_path, tallied_model):
+    model = tallied_model([["A", "B", "C", "D"], ["B", "A", "C", "D"]])
+    text_file = model.save_results(str(tmp_path))
+    expected = 0o666 & ~jax._current_umask()
+    for extension in (".txt", ".csv", jax.BallotArchive.EXTENSION):
+        assert stat.S_IMODE(os.stat(text_file[:-4] + extension).st_mode) == expected
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_rewrite_keeps_existing_mode(tmp_path):
+    path = tmp_path / "report.txt"
+    path.write_text("old", encoding="utf-8")
+    os.chmod(path, 0o640)
+    jax._write_atomic(str(path), "new")
+    assert path.read_text(encoding="utf-8") == "new"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+
+
+class StubRoot:
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, callback):
+        self.pending.append(callback)
+        return f"after#{len(self.pending)}"
+
+
+def test_background_save_matches_a_synchronous_save(tmp_path, monkeypatch, tallied_model):
+    monkeypatch.setattr(jax, "datetime", FrozenDateTime)
+    ballots = [["A", "B", "C", "D", "E"], ["E", "D", "C", "B", "A"], ["C", "A", "E", "B", "D"]]
+    sync_file = tallied_model(ballots).save_results(str(tmp_path / "sync"))
+    
+    monkeypatch.chdir(tmp_path)
+    controller = jax.GameVotingController.__new__(jax.GameVotingController)
+    controller.root = StubRoot()
+    controller.model = tallied_model(ballots)
+    controller.results_writer = jax.ThreadPoolExecutor(max_workers=1)
+    saved = []
+    controller.save_results_async(lambda filename, error: saved.append((filename, error)))
+    controller.results_writer.shutdown(wait=True)
+    while not saved:
+        controller.root.pending.pop(0)()
+    
+    async_file, error = saved[0]
+    assert error is None
+    assert os.path.basename(async_file) == os.path.basename(sync_file)
+    for extension in (".txt", ".csv", jax.BallotArchive.EXTENSION):
+        with open(sync_file[:-4] + extension, "rb") as expected, open(async_file[:-4] + extension, "rb") as actual:
+            assert actual.read() == expected.read()
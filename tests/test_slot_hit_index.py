@@ -0,0 +1,44 @@
+import random
+
+import boys_night_vote_Jax as jax
+
+
+def random_slot_grid(rng):
+    """Non-overlapping slot rectangles in ragged columns of uneven widths and heights"""
+    rects = []
+    x = rng.randint(-50, 50)
+    for column in range(rng.randint(1, 4)):
+        width = rng.randint(1, 300)
+        y = rng.randint(-50, 50)
+        for row in range(rng.randint(1, 12)):
+            height = rng.randint(1, 80)
+            rects.append((x, y, x + width, y + height, (column, row)))
+            y += height + rng.randint(1, 20)
+        x += width + rng.randint(1, 40)
+    return rects
+
+
+def brute_force_slot_at(rects, x, y):
+    hits = [slot for x0, y0, x1, y1, slot in rects if x0 <= x <= x1 and y0 <= y <= y1]
+    assert len(hits) <= 1
+    return hits[0] if hits else None
+
+
+def test_slot_at_matches_a_brute_force_scan():
+    rng = random.Random(12)
+    for _ in range(200):
+        rects = random_slot_grid(rng)
+        index = jax.SlotHitIndex(rects)
+        right = max(rect[2] for rect in rects)
+        bottom = max(rect[3] for rect in rects)
+        points = [(rng.randint(-80, right + 30), rng.randint(-80, bottom + 30)) for _ in range(500)]
+        # Every corner and the pixels just outside it, where off-by-one mistakes show up
+        for x0, y0, x1, y1, _ in rects:
+            points.extend((x + dx, y + dy) for x in (x0, x1) for y in (y0, y1) 
+                          for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+        for x, y in points:
+            assert index.slot_at(x, y) == brute_force_slot_at(rects, x, y), (x, y)
+
+
+def test_empty_index_hits_nothing():
+    assert jax.SlotHitIndex([]).slot_at(0, 0) is None
@@ -0,0 +1,67 @@
+import math
+import random
+
+import pytest
+
+import boys_night_vote_Jax as jax
+
+pytest.importorskip("numpy")
+
+
+def random_election(rng):
+    num_games = rng.randint(1, 12)
+    games = [f"G{i}" for i in range(num_games)]
+    kind = rng.choice(["full", "ragged", "tied", "majority"])
+    ballots = []
+    for _ in range(rng.randint(1, 12)):
+        ballot = rng.sample(games, num_games)
+        if kind == "ragged":
+            ballot = ballot[:rng.randint(1, num_games)]
+        ballots.append(ballot)
+    if kind == "tied":
+        # Mirrored ballots force equal totals and deep tie-breaks
+        ballots = ballots[:1] + [list(reversed(ballots[0]))] if num_games > 1 else ballots
+        ballots *= rng.randint(1, 3)
+    elif kind == "majority":
+        ballots += [[games[0]]] * rng.randint(5, 20)
+    return games, ballots
+
+
+def tally(games, ballots, backend, seed):
+    model = jax.JaxVotingSystem()
+    model.tally_backend = backend
+    for game in games:
+        model.add_game(game)
+    model.ingest_ballots(ballots)
+    jax.random.seed(seed)  # deep ties fall back to random.choice
+    return model.calculate_jax_method_voting()
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_numpy_engine_matches_python_engine(seed):
+    rng = random.Random(seed)
+    for trial in range(150):
+        games, ballots = random_election(rng)
+        python_winner, python_results = tally(games, ballots, "python", trial)
+        numpy_winner, numpy_results = tally(games, ballots, "numpy", trial)
+        
+        assert numpy_winner == python_winner
+        python_rounds = python_results["rounds"]
+        numpy_rounds = numpy_results["rounds"]
+        assert [r.get("eliminated") for r in numpy_rounds] == [r.get("eliminated") for r in python_rounds]
+        for python_round, numpy_round in zip(python_rounds, numpy_rounds):
+            assert numpy_round["game_totals"].keys() == python_round["game_totals"].keys()
+            for game, total in python_round["game_totals"].items():
+                assert math.isclose(numpy_round["game_totals"][game], total, rel_tol=1e-12, abs_tol=1e-9)
+        assert [entry["game"] for entry in numpy_results["podium"]] == \
+            [entry["game"] for entry in python_results["podium"]]
+
+
+def test_majority_cases_are_generated():
+    rng = random.Random(0)
+    majority_wins = 0
+    for trial in range(150):
+        games, ballots = random_election(rng)
+        winner, results = tally(games, ballots, "numpy", trial)
+        majority_wins += len(games) > 3 and len(results["podium"]) == 1
+    assert majority_wins > 0